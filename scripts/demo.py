@@ -320,7 +320,7 @@ def create_reporter() -> BaseReporter:
 def main_report() -> None:
     r"""Define the main function to generate a report."""
     reporter = create_reporter()
-    logger.info(f"reporter:\n{reporter}")
+    logger.info("reporter:\n%s", reporter)
     reporter.compute()
 
 
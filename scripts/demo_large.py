@@ -14,7 +14,6 @@ from grizz.transformer import BaseTransformer, SequentialTransformer
 
 from flamme import analyzer as fa
 from flamme.reporter import BaseReporter, Reporter
-from flamme.utils.array import rand_replace
 from flamme.utils.logging import configure_logging
 
 logger = logging.getLogger(__name__)
@@ -33,16 +32,12 @@ def create_dataframe(nrows: int = 1000, ncols: int = 100) -> pl.DataFrame:
         The generated DataFrame.
     """
     rng = np.random.default_rng(42)
-    frame = pl.DataFrame(
-        rand_replace(
-            rng.normal(size=(nrows, ncols)),
-            value=None,
-            prob=0.4,
-            rng=rng,
-        ).tolist(),
-        schema={f"feature{i:04}": pl.Float64 for i in range(ncols)},
-        orient="row",
-    )
+    columns = {}
+    for i in range(ncols):
+        values = rng.normal(size=(nrows,))
+        values[rng.random(size=(nrows,)) < 0.4] = np.nan
+        columns[f"feature{i:04}"] = pl.Series(values, dtype=pl.Float64, nan_to_null=True)
+    frame = pl.DataFrame(columns)
     return frame.with_columns(
         pl.datetime_range(
             start=datetime(year=2018, month=1, day=1, tzinfo=timezone.utc),
@@ -191,7 +186,7 @@ def create_reporter() -> BaseReporter:
 def main_report() -> None:
     r"""Define the main function to generate a report."""
     reporter = create_reporter()
-    logger.info(f"reporter:\n{reporter}")
+    logger.info("reporter:\n%s", reporter)
     reporter.compute()
 
 
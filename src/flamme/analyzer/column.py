@@ -76,5 +76,8 @@ class ColumnSubsetAnalyzer(BaseAnalyzer):
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     def analyze(self, frame: pl.DataFrame) -> BaseSection:
-        logger.info(f"Selecting {len(self._columns):,} columns: {self._columns}")
+        logger.info("Selecting %s columns: %s", f"{len(self._columns):,}", self._columns)
+        if self._columns == frame.columns:
+            # Analyze the input DataFrame so the cached intermediate results are reused.
+            return self._analyzer.analyze(frame)
         return self._analyzer.analyze(frame.select(self._columns))
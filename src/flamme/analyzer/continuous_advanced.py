@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnContinuousAdvancedSection, EmptySection
+from flamme.utils.cache import get_column_set
 
 if TYPE_CHECKING:
     import polars as pl
@@ -71,7 +72,7 @@ class ColumnContinuousAdvancedAnalyzer(BaseAnalyzer):
 
     def analyze(self, frame: pl.DataFrame) -> ColumnContinuousAdvancedSection | EmptySection:
         logger.info(f"Analyzing the continuous distribution of {self._column}")
-        if self._column not in frame:
+        if self._column not in get_column_set(frame):
             logger.warning(
                 "Skipping temporal continuous distribution analysis because the column "
                 f"({self._column}) is not in the DataFrame"
@@ -11,6 +11,7 @@ from coola.utils import repr_indent, repr_mapping
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnContinuousTemporalDriftSection, EmptySection
+from flamme.utils.cache import get_column_set
 
 if TYPE_CHECKING:
     import polars as pl
@@ -129,7 +130,7 @@ class ColumnContinuousTemporalDriftAnalyzer(BaseAnalyzer):
     def analyze(self, frame: pl.DataFrame) -> ColumnContinuousTemporalDriftSection | EmptySection:
         logger.info(f"Analyzing the temporal drift of {self._column}")
         for column in [self._column, self._dt_column]:
-            if column not in frame:
+            if column not in get_column_set(frame):
                 logger.info(
                     f"Skipping temporal drift analysis because the column ({column}) is not "
                     f"in the DataFrame"
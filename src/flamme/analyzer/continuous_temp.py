@@ -11,6 +11,7 @@ import polars as pl
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnTemporalContinuousSection, EmptySection
+from flamme.utils.cache import get_column_set
 
 if TYPE_CHECKING:
     import polars as pl
@@ -102,7 +103,7 @@ class ColumnTemporalContinuousAnalyzer(BaseAnalyzer):
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
         for column in [self._column, self._dt_column]:
-            if column not in frame:
+            if column not in get_column_set(frame):
                 logger.info(
                     "Skipping temporal continuous distribution analysis because the column "
                     f"({column}) is not in the DataFrame"
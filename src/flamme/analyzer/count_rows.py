@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import EmptySection, TemporalRowCountSection
+from flamme.utils.cache import get_column_set
 
 if TYPE_CHECKING:
     import polars as pl
@@ -77,7 +78,7 @@ class TemporalRowCountAnalyzer(BaseAnalyzer):
             f"Analyzing the number of rows | "
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
-        if self._dt_column not in frame:
+        if self._dt_column not in get_column_set(frame):
             logger.warning(
                 "Skipping number of rows analysis because the datetime column "
                 f"({self._dt_column}) is not in the DataFrame"
@@ -5,11 +5,12 @@ from __future__ import annotations
 __all__ = ["ColumnDiscreteAnalyzer"]
 
 import logging
-from collections import Counter
 from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnDiscreteSection, EmptySection
+from flamme.utils.cache import get_column_set
+from flamme.utils.count import compute_column_value_counts
 
 if TYPE_CHECKING:
     import polars as pl
@@ -84,19 +85,19 @@ class ColumnDiscreteAnalyzer(BaseAnalyzer):
 
     def analyze(self, frame: pl.DataFrame) -> ColumnDiscreteSection | EmptySection:
         logger.info(f"Analyzing the discrete distribution of {self._column}")
-        if self._column not in frame:
+        if self._column not in get_column_set(frame):
             logger.warning(
                 f"Skipping discrete distribution analysis of column {self._column} "
                 f"because it is not in the DataFrame"
             )
             return EmptySection()
-        series = frame[self._column]
+        counter = compute_column_value_counts(frame, self._column)
         if self._drop_nulls:
-            series = series.drop_nulls()
+            counter.pop(None, None)
         return ColumnDiscreteSection(
-            counter=Counter(series.to_list()),
-            null_values=series.null_count(),
-            dtype=series.dtype,
+            counter=counter,
+            null_values=counter.get(None, 0),
+            dtype=frame[self._column].dtype,
             column=self._column,
             max_rows=self._max_rows,
             yscale=self._yscale,
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnTemporalDiscreteSection, EmptySection
+from flamme.utils.cache import get_column_set
 
 if TYPE_CHECKING:
     import polars as pl
@@ -90,7 +91,7 @@ class ColumnTemporalDiscreteAnalyzer(BaseAnalyzer):
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
         for column in [self._column, self._dt_column]:
-            if column not in frame:
+            if column not in get_column_set(frame):
                 logger.info(
                     "Skipping temporal discrete distribution analysis because the column "
                     f"({column}) is not in the DataFrame"
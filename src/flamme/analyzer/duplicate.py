@@ -69,5 +69,5 @@ class DuplicatedRowAnalyzer(BaseAnalyzer):
         return f"{self.__class__.__qualname__}(columns={self._columns}, figsize={self._figsize})"
 
     def analyze(self, frame: pl.DataFrame) -> DuplicatedRowSection:
-        logger.info(f"Analyzing the duplicated rows section using the columns: {self._columns}")
+        logger.info("Analyzing the duplicated rows section using the columns: %s", self._columns)
         return DuplicatedRowSection(frame=frame, columns=self._columns, figsize=self._figsize)
@@ -22,6 +22,9 @@ class DataFrameSummaryAnalyzer(BaseAnalyzer):
     Args:
         top: The number of most frequent values to show.
         sort: If ``True``, sort the columns by alphabetical order.
+        max_workers: The maximum number of threads used to count
+            the values of the columns. The columns are processed
+            sequentially if this value is ``1``.
 
     Example usage:
 
@@ -31,7 +34,7 @@ class DataFrameSummaryAnalyzer(BaseAnalyzer):
     >>> from flamme.analyzer import DataFrameSummaryAnalyzer
     >>> analyzer = DataFrameSummaryAnalyzer()
     >>> analyzer
-    DataFrameSummaryAnalyzer(top=5, sort=False)
+    DataFrameSummaryAnalyzer(top=5, sort=False, max_workers=1)
     >>> frame = pl.DataFrame(
     ...     {
     ...         "col1": [0, 1, 0, 1],
@@ -47,18 +50,25 @@ class DataFrameSummaryAnalyzer(BaseAnalyzer):
     ```
     """
 
-    def __init__(self, top: int = 5, sort: bool = False) -> None:
+    def __init__(self, top: int = 5, sort: bool = False, max_workers: int = 1) -> None:
         if top < 0:
             msg = f"Incorrect top value ({top}). top must be positive"
             raise ValueError(msg)
         self._top = top
         self._sort = bool(sort)
+        if max_workers < 1:
+            msg = f"Incorrect max_workers: {max_workers}. max_workers must be greater than 0"
+            raise ValueError(msg)
+        self._max_workers = max_workers
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(top={self._top:,}, sort={self._sort})"
+        return (
+            f"{self.__class__.__qualname__}(top={self._top:,}, sort={self._sort}, "
+            f"max_workers={self._max_workers})"
+        )
 
     def analyze(self, frame: pl.DataFrame) -> DataFrameSummarySection:
         logger.info("Analyzing the DataFrame...")
-        if self._sort:
-            frame = frame.select(sorted(frame.columns))
-        return DataFrameSummarySection(frame=frame, top=self._top)
+        if self._sort and (columns := sorted(frame.columns)) != frame.columns:
+            frame = frame.select(columns)
+        return DataFrameSummarySection(frame=frame, top=self._top, max_workers=self._max_workers)
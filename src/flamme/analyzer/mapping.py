@@ -4,6 +4,8 @@ from __future__ import annotations
 
 __all__ = ["MappingAnalyzer"]
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from coola.utils import str_indent, str_mapping
@@ -27,6 +29,11 @@ class MappingAnalyzer(BaseAnalyzer):
         max_toc_depth: The maximum level to show in the
             table of content. Set this value to ``0`` to not show
             the table of content at the beginning of the section.
+        max_workers: The maximum number of threads used to run the
+            analyzers. The analyzers are run sequentially if this
+            value is ``1``. Most of the polars operations release the
+            GIL, so the analyzers can run concurrently on the same
+            DataFrame.
 
     Example usage:
 
@@ -45,6 +52,7 @@ class MappingAnalyzer(BaseAnalyzer):
     MappingAnalyzer(
       (null): NullValueAnalyzer(figsize=None)
       (duplicate): DuplicatedRowAnalyzer(columns=None, figsize=None)
+      (max_workers): 1
     )
     >>> frame = pl.DataFrame(
     ...     {
@@ -74,21 +82,46 @@ class MappingAnalyzer(BaseAnalyzer):
     """
 
     def __init__(
-        self, analyzers: Mapping[str, BaseAnalyzer | dict], max_toc_depth: int = 0
+        self,
+        analyzers: Mapping[str, BaseAnalyzer | dict],
+        max_toc_depth: int = 0,
+        max_workers: int = 1,
     ) -> None:
         self._analyzers = {name: setup_analyzer(analyzer) for name, analyzer in analyzers.items()}
         self._max_toc_depth = max_toc_depth
+        if max_workers < 1:
+            msg = f"Incorrect max_workers: {max_workers}. max_workers must be greater than 0"
+            raise ValueError(msg)
+        self._max_workers = max_workers
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(\n  {str_indent(str_mapping(self._analyzers))}\n)"
+        return (
+            f"{self.__class__.__qualname__}(\n  {str_indent(str_mapping(self._analyzers))}\n"
+            f"  (max_workers): {self._max_workers}\n)"
+        )
 
     @property
     def analyzers(self) -> dict[str, BaseAnalyzer]:
         return self._analyzers
 
     def analyze(self, frame: pl.DataFrame) -> SectionDict:
+        if self._max_workers == 1 or len(self._analyzers) <= 1:
+            sections = [analyzer.analyze(frame) for analyzer in self._analyzers.values()]
+        else:
+            # Each analyzer runs in a copy of the current context, so the
+            # worker threads share the frame cache scope of the caller.
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(self._analyzers))
+            ) as executor:
+                sections = list(
+                    executor.map(
+                        lambda analyzer: context.copy().run(analyzer.analyze, frame),
+                        self._analyzers.values(),
+                    )
+                )
         return SectionDict(
-            sections={name: analyzer.analyze(frame) for name, analyzer in self._analyzers.items()},
+            sections=dict(zip(self._analyzers.keys(), sections)),
             max_toc_depth=self._max_toc_depth,
         )
 
@@ -118,6 +151,7 @@ class MappingAnalyzer(BaseAnalyzer):
         MappingAnalyzer(
           (null): NullValueAnalyzer(figsize=None)
           (duplicate): DuplicatedRowAnalyzer(columns=None, figsize=None)
+          (max_workers): 1
         )
         >>> frame = pl.DataFrame(
         ...     {
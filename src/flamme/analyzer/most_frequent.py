@@ -6,11 +6,12 @@ from __future__ import annotations
 __all__ = ["MostFrequentValuesAnalyzer"]
 
 import logging
-from collections import Counter
 from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import EmptySection, MostFrequentValuesSection
+from flamme.utils.cache import get_column_set
+from flamme.utils.count import compute_column_value_counts
 
 if TYPE_CHECKING:
     import polars as pl
@@ -63,17 +64,17 @@ class MostFrequentValuesAnalyzer(BaseAnalyzer):
 
     def analyze(self, frame: pl.DataFrame) -> MostFrequentValuesSection | EmptySection:
         logger.info(f"Analyzing the most frequent values of {self._column}")
-        if self._column not in frame:
+        if self._column not in get_column_set(frame):
             logger.warning(
                 f"Skipping most frequent values analysis of column {self._column} "
                 f"because the column is missing"
             )
             return EmptySection()
-        series = frame[self._column]
+        counter = compute_column_value_counts(frame, self._column)
         if self._drop_nulls:
-            series = series.drop_nulls()
+            counter.pop(None, None)
         return MostFrequentValuesSection(
-            counter=Counter(series.to_list()),
+            counter=counter,
             column=self._column,
             top=self._top,
         )
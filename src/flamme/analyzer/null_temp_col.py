@@ -12,6 +12,7 @@ from coola.utils import repr_indent, repr_mapping
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnTemporalNullValueSection, EmptySection
+from flamme.utils.cache import get_column_set
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -119,7 +120,7 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
             "Analyzing the temporal null value distribution of all columns | "
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
-        if self._dt_column not in frame:
+        if self._dt_column not in get_column_set(frame):
             logger.warning(
                 "Skipping monthly null value analysis because the datetime column "
                 f"({self._dt_column}) is not in the DataFrame"
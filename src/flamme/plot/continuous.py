@@ -193,7 +193,9 @@ def hist_continuous(
     if array.size == 0:
         return
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.hist(array, bins=nbins, range=(xmin, xmax), color="tab:blue", alpha=0.9, density=density)
+    # The bins are drawn as a single step patch instead of one rectangle per bin.
+    counts, edges = np.histogram(array, bins=nbins or 10, range=(xmin, xmax), density=density)
+    ax.stairs(counts, edges, fill=True, color="tab:blue", alpha=0.9)
     readable_xticklabels(ax, max_num_xticks=100)
     if xmin < xmax:
         ax.set_xlim(xmin, xmax)
@@ -273,24 +275,9 @@ def hist_continuous2(
     if array.size == 0:
         return
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.hist(
-        array1,
-        bins=nbins,
-        range=(xmin, xmax),
-        color="tab:blue",
-        alpha=0.5,
-        label=label1,
-        density=density,
-    )
-    ax.hist(
-        array2,
-        bins=nbins,
-        range=(xmin, xmax),
-        color="tab:orange",
-        alpha=0.5,
-        label=label2,
-        density=density,
-    )
+    for arr, color, label in [(array1, "tab:blue", label1), (array2, "tab:orange", label2)]:
+        counts, edges = np.histogram(arr, bins=nbins or 10, range=(xmin, xmax), density=density)
+        ax.stairs(counts, edges, fill=True, color=color, alpha=0.5, label=label)
     readable_xticklabels(ax, max_num_xticks=100)
     if xmin < xmax:
         ax.set_xlim(xmin, xmax)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 __all__ = ["bar_discrete", "bar_discrete_temporal"]
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -48,11 +49,19 @@ def bar_discrete(
     if n == 0:
         return
     x = np.arange(n)
-    ax.bar(x, counts, width=0.9 if n < 50 else 1, color="tab:blue")
+    if n < 50:
+        ax.bar(x, counts, width=0.9, color="tab:blue")
+    else:
+        # The bars are contiguous, so they are drawn as a single artist
+        # instead of one patch per value.
+        ax.stairs(counts, np.arange(n + 1) - 0.5, fill=True, color="tab:blue")
     if yscale == "auto":
         yscale = auto_yscale_discrete(min_count=min(counts), max_count=max(counts))
     ax.set_yscale(yscale)
-    ax.set_xticks(x, labels=map(str, names))
+    # Only the ticks kept by readable_xticklabels are created because
+    # creating one tick per value is slow when there are many values.
+    step = math.ceil(n / 100)
+    ax.set_xticks(x[::step], labels=[str(name) for name in names[::step]])
     readable_xticklabels(ax, max_num_xticks=100)
     ax.set_xlim(-0.5, len(names) - 0.5)
     ax.set_xlabel("values")
@@ -101,17 +110,30 @@ def bar_discrete_temporal(
 
     x = np.arange(num_steps, dtype=np.int64)
     bottom = np.zeros(num_steps, dtype=counts.dtype)
-    width = 0.9 if num_steps < 50 else 1
+    edges = np.arange(num_steps + 1) - 0.5
     my_cmap = plt.get_cmap("viridis")
     for i in range(num_values):
         count = counts[i]
-        ax.bar(x, count, label=values[i], bottom=bottom, width=width, color=my_cmap(i / num_values))
+        if num_steps < 50:
+            ax.bar(
+                x, count, label=values[i], bottom=bottom, width=0.9, color=my_cmap(i / num_values)
+            )
+        else:
+            ax.stairs(
+                bottom + count,
+                edges,
+                baseline=bottom.copy(),
+                fill=True,
+                label=values[i],
+                color=my_cmap(i / num_values),
+            )
         bottom += count
 
     num_valid_values = len(list(filter(lambda x: x is not None, values)))
     if num_valid_values <= 10 and num_valid_values > 0:
         ax.legend()
-    ax.set_xticks(x, labels=steps)
+    step = math.ceil(num_steps / 100)
+    ax.set_xticks(x[::step], labels=steps[::step])
     readable_xticklabels(ax, max_num_xticks=100)
     ax.set_xlim(-0.5, num_steps - 0.5)
     ax.set_ylabel("steps")
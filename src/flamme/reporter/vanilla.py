@@ -16,6 +16,7 @@ from iden.io import save_text
 from flamme.analyzer.base import BaseAnalyzer, setup_analyzer
 from flamme.reporter.base import BaseReporter
 from flamme.reporter.utils import create_html_report
+from flamme.utils.cache import frame_cache_scope
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -62,11 +63,11 @@ class Reporter(BaseReporter):
         max_toc_depth: int = 6,
     ) -> None:
         self._ingestor = setup_ingestor(ingestor)
-        logger.info(f"ingestor:\n{ingestor}")
+        logger.info("ingestor:\n%s", ingestor)
         self._transformer = setup_transformer(transformer)
-        logger.info(f"transformer:\n{transformer}")
+        logger.info("transformer:\n%s", transformer)
         self._analyzer = setup_analyzer(analyzer)
-        logger.info(f"analyzer:\n{analyzer}")
+        logger.info("analyzer:\n%s", analyzer)
         self._report_path = sanitize_path(report_path)
         self._max_toc_depth = int(max_toc_depth)
 
@@ -89,12 +90,15 @@ class Reporter(BaseReporter):
         frame = self._ingestor.ingest()
         logger.info(f"Transforming the DataFrame {frame.shape}...")
         frame = self._transformer.transform(frame)
-        logger.info(f"Analyzing the DataFrame {frame.shape}...")
-        section = self._analyzer.analyze(frame)
-        logger.info("Creating the HTML report...")
-        report = create_html_report(
-            toc=section.render_html_toc(max_depth=self._max_toc_depth),
-            body=section.render_html_body(),
-        )
+        # The intermediate results are shared by the analyzers and the
+        # sections, and are released once the report is created.
+        with frame_cache_scope():
+            logger.info(f"Analyzing the DataFrame {frame.shape}...")
+            section = self._analyzer.analyze(frame)
+            logger.info("Creating the HTML report...")
+            report = create_html_report(
+                toc=section.render_html_toc(max_depth=self._max_toc_depth),
+                body=section.render_html_body(),
+            )
         logger.info(f"Saving HTML report at {self._report_path}...")
         save_text(report, self._report_path, exist_ok=True)
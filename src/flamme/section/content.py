@@ -8,11 +8,10 @@ __all__ = ["ContentSection", "create_section_template"]
 import logging
 from typing import TYPE_CHECKING
 
-from jinja2 import Template
-
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -57,7 +56,7 @@ class ContentSection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the section with the custom content...")
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
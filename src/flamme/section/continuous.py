@@ -13,10 +13,10 @@ __all__ = [
 ]
 
 import logging
+import math
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import boxplot_continuous, hist_continuous
@@ -24,13 +24,14 @@ from flamme.plot.utils.hist import adjust_nbins
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
 from flamme.utils.array import filter_range, nonnan
-from flamme.utils.figure import figure2html
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html
 from flamme.utils.range import find_range
 from flamme.utils.stats import compute_statistics_continuous
 
@@ -166,8 +167,10 @@ class ColumnContinuousSection(BaseSection):
         null_values_pct = (
             f"{100 * stats['num_nulls'] / stats['count']:.2f}" if stats["count"] > 0 else "N/A"
         )
+        # The figures are not created if there is no value to plot.
+        has_values = not math.isnan(stats["min"])
         xmin, xmax = find_range(to_array(self._series), xmin=self._xmin, xmax=self._xmax)
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -180,8 +183,12 @@ class ColumnContinuousSection(BaseSection):
                 "unique_values": f"{stats['nunique']:,}",
                 "null_values": f"{stats['num_nulls']:,}",
                 "null_values_pct": null_values_pct,
-                "histogram_figure": self._create_histogram_figure(),
-                "boxplot_figure": self._create_boxplot_figure(),
+                "histogram_figure": (
+                    self._create_histogram_figure() if has_values else MISSING_FIGURE_MESSAGE
+                ),
+                "boxplot_figure": (
+                    self._create_boxplot_figure() if has_values else MISSING_FIGURE_MESSAGE
+                ),
                 "min_value": f"{stats['min']:,}",
                 "max_value": f"{stats['max']:,}",
                 "xmin": f"{xmin:,}",
@@ -406,7 +413,7 @@ def create_stats_table(stats: dict, column: str) -> str:
 
     ```
     """
-    return Template(
+    return compile_template(
         """<details>
     <summary>[show statistics]</summary>
 
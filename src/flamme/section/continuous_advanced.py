@@ -10,11 +10,11 @@ __all__ = [
 ]
 
 import logging
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import hist_continuous
@@ -26,12 +26,13 @@ from flamme.section.continuous import (
 )
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.figure import figure2html
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html
 from flamme.utils.range import find_range
 from flamme.utils.stats import compute_statistics_continuous
 
@@ -144,7 +145,9 @@ class ColumnContinuousAdvancedSection(BaseSection):
         null_values_pct = (
             f"{100 * stats['num_nulls'] / stats['count']:.2f}" if stats["count"] > 0 else "N/A"
         )
-        return Template(create_section_template()).render(
+        # The figures are not created if there is no value to plot.
+        has_values = not math.isnan(stats["min"])
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -157,9 +160,15 @@ class ColumnContinuousAdvancedSection(BaseSection):
                 "unique_values": f"{stats['nunique']:,}",
                 "null_values": f"{stats['num_nulls']:,}",
                 "null_values_pct": null_values_pct,
-                "full_histogram": self._create_full_histogram(),
-                "iqr_histogram": self._create_iqr_histogram(),
-                "full_boxplot": self._create_full_boxplot(),
+                "full_histogram": (
+                    self._create_full_histogram() if has_values else MISSING_FIGURE_MESSAGE
+                ),
+                "iqr_histogram": (
+                    self._create_iqr_histogram() if has_values else MISSING_FIGURE_MESSAGE
+                ),
+                "full_boxplot": (
+                    self._create_full_boxplot() if has_values else MISSING_FIGURE_MESSAGE
+                ),
             }
         )
 
@@ -13,7 +13,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import hist_continuous2
@@ -22,16 +21,18 @@ from flamme.plot.utils.hist import adjust_nbins
 from flamme.section import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
 from flamme.utils.array import filter_range
+from flamme.utils.cache import get_column_set
 from flamme.utils.figure import figure2html
 from flamme.utils.mapping import sort_by_keys
 from flamme.utils.range import find_range
-from flamme.utils.temporal import to_temporal_frames
+from flamme.utils.temporal import to_temporal_arrays
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -205,7 +206,7 @@ class ColumnContinuousTemporalDriftSection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the temporal drift of {self._column}")
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -338,7 +339,8 @@ def create_temporal_drift_figure(
 
     ```
     """
-    if column not in frame or dt_column not in frame:
+    columns = get_column_set(frame)
+    if column not in columns or dt_column not in columns:
         return None
     array = frame[column].drop_nulls().drop_nans().to_numpy()
     if array.size == 0:
@@ -346,10 +348,10 @@ def create_temporal_drift_figure(
 
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
     nbins = adjust_nbins(nbins=nbins, array=filter_range(array, xmin=xmin, xmax=xmax))
-    frames, steps = to_temporal_frames(
-        frame=frame.select(column, dt_column), dt_column=dt_column, period=period
+    arrays, steps = to_temporal_arrays(
+        frame=frame, column=column, dt_column=dt_column, period=period
     )
-    groups = sort_by_keys(dict(zip(steps, [fr[column].to_numpy() for fr in frames])))
+    groups = sort_by_keys(dict(zip(steps, arrays)))
 
     nrows = len(steps)
     steps1, steps2 = steps[:-1], steps[1:]
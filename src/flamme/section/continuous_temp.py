@@ -15,26 +15,27 @@ import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
-import polars as pl
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import boxplot_continuous_temporal
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
 from flamme.utils.figure import figure2html
-from flamme.utils.temporal import compute_temporal_stats, to_step_names
+from flamme.utils.temporal import compute_temporal_stats, to_temporal_arrays
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import polars as pl
+
 
 logger = logging.getLogger(__name__)
 
@@ -160,7 +161,7 @@ class ColumnTemporalContinuousSection(BaseSection):
             f"Rendering the temporal continuous distribution of {self._column} | "
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -287,13 +288,10 @@ def create_temporal_figure(
     """
     if frame.is_empty():
         return None
-    groups = (
-        frame.select(pl.col(dt_column).alias("datetime"), pl.col(column).alias("value"))
-        .sort("datetime")
-        .group_by_dynamic("datetime", every=period)
+    arrays, steps = to_temporal_arrays(
+        frame=frame, column=column, dt_column=dt_column, period=period
     )
-    data = [np.sort(np.array(x["value"])) for _, x in groups]
-    steps = to_step_names(groups=groups, period=period)
+    data = [np.sort(array) for array in arrays]
     fig, ax = plt.subplots(figsize=figsize)
     boxplot_continuous_temporal(ax=ax, data=data, steps=steps, yscale=yscale)
     return fig
@@ -352,7 +350,7 @@ def create_temporal_table(frame: pl.DataFrame, column: str, dt_column: str, peri
     stats = compute_temporal_stats(frame=frame, column=column, dt_column=dt_column, period=period)
 
     rows = [create_temporal_table_row(stat) for stat in stats.to_dicts()]
-    return Template(
+    return compile_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -433,41 +431,21 @@ def create_temporal_table_row(stats: dict) -> str:
             return float("nan")
         return value
 
-    return Template(
-        """<tr>
-    <th>{{step}}</th>
-    <td {{num_style}}>{{count}}</td>
-    <td {{num_style}}>{{mean}}</td>
-    <td {{num_style}}>{{std}}</td>
-    <td {{num_style}}>{{min}}</td>
-    <td {{num_style}}>{{q01}}</td>
-    <td {{num_style}}>{{q05}}</td>
-    <td {{num_style}}>{{q10}}</td>
-    <td {{num_style}}>{{q25}}</td>
-    <td {{num_style}}>{{median}}</td>
-    <td {{num_style}}>{{q75}}</td>
-    <td {{num_style}}>{{q90}}</td>
-    <td {{num_style}}>{{q95}}</td>
-    <td {{num_style}}>{{q99}}</td>
-    <td {{num_style}}>{{max}}</td>
+    num_style = 'style="text-align: right;"'
+    return f"""<tr>
+    <th>{stats["step"]}</th>
+    <td {num_style}>{stats["count"]:,}</td>
+    <td {num_style}>{to_float(stats["mean"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["std"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["min"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q01"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q05"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q10"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q25"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["median"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q75"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q90"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q95"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["q99"]):,.4f}</td>
+    <td {num_style}>{to_float(stats["max"]):,.4f}</td>
 </tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "step": stats["step"],
-            "count": f"{stats['count']:,}",
-            "mean": f"{to_float(stats['mean']):,.4f}",
-            "median": f"{to_float(stats['median']):,.4f}",
-            "min": f"{to_float(stats['min']):,.4f}",
-            "max": f"{to_float(stats['max']):,.4f}",
-            "std": f"{to_float(stats['std']):,.4f}",
-            "q01": f"{to_float(stats['q01']):,.4f}",
-            "q05": f"{to_float(stats['q05']):,.4f}",
-            "q10": f"{to_float(stats['q10']):,.4f}",
-            "q25": f"{to_float(stats['q25']):,.4f}",
-            "q75": f"{to_float(stats['q75']):,.4f}",
-            "q90": f"{to_float(stats['q90']):,.4f}",
-            "q95": f"{to_float(stats['q95']):,.4f}",
-            "q99": f"{to_float(stats['q99']):,.4f}",
-        }
-    )
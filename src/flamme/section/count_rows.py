@@ -14,18 +14,19 @@ __all__ = [
 import logging
 from typing import TYPE_CHECKING
 
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.cache import get_column_set
 from flamme.utils.count import compute_temporal_count
 from flamme.utils.figure import figure2html
 
@@ -89,7 +90,7 @@ class TemporalRowCountSection(BaseSection):
         period: str,
         figsize: tuple[float, float] | None = None,
     ) -> None:
-        if dt_column not in frame:
+        if dt_column not in get_column_set(frame):
             msg = (
                 f"Datetime column {dt_column} is not in the DataFrame "
                 f"(columns:{sorted(frame.columns)})"
@@ -137,7 +138,7 @@ class TemporalRowCountSection(BaseSection):
             "Rendering the number of rows per temporal window "
             f"| datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -243,7 +244,7 @@ def create_temporal_count_figure(
 
     ```
     """
-    if frame.is_empty() or dt_column not in frame:
+    if frame.is_empty() or dt_column not in get_column_set(frame):
         return None
 
     counts, labels = compute_temporal_count(frame=frame, dt_column=dt_column, period=period)
@@ -302,7 +303,7 @@ def create_temporal_count_table(frame: pl.DataFrame, dt_column: str, period: str
         create_temporal_count_table_row(label=label, num_rows=num_rows)
         for label, num_rows in zip(labels, counts)
     ]
-    return Template(
+    return compile_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -347,10 +348,4 @@ def create_temporal_count_table_row(label: str, num_rows: int) -> str:
 
     ```
     """
-    return Template("<tr><th>{{label}}</th><td {{num_style}}>{{num_rows}}</td></tr>").render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "label": label,
-            "num_rows": f"{num_rows:,}",
-        }
-    )
+    return f'<tr><th>{label}</th><td style="text-align: right;">{num_rows:,}</td></tr>'
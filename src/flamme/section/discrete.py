@@ -12,10 +12,9 @@ __all__ = [
 ]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import bar_discrete
@@ -23,6 +22,7 @@ from flamme.section.base import BaseSection
 from flamme.section.most_frequent import create_frequent_values_table
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -97,6 +97,7 @@ class ColumnDiscreteSection(BaseSection):
         self._dtype = dtype
 
         self._total = sum(self._counter.values())
+        self._most_common: list[tuple[Any, int]] | None = None
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -125,9 +126,9 @@ class ColumnDiscreteSection(BaseSection):
         return self._yscale
 
     def get_statistics(self) -> dict:
-        most_common = [(value, count) for value, count in self._counter.most_common() if count > 0]
+        most_common = self._get_most_common()
         return {
-            "most_common": most_common,
+            "most_common": list(most_common),
             "null_values": self._null_values,
             "nunique": len(most_common),
             "total": self._total,
@@ -139,7 +140,7 @@ class ColumnDiscreteSection(BaseSection):
         null_values_pct = (
             f"{100 * self._null_values / stats['total']:.2f}" if stats["total"] > 0 else "N/A"
         )
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -171,6 +172,17 @@ class ColumnDiscreteSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
+    def _get_most_common(self) -> list[tuple[Any, int]]:
+        # Sorting all the values is the most expensive part of the
+        # statistics, so the sorted values are computed only once.
+        if self._most_common is None:
+            self._most_common = self._counter.most_common()
+            if min(self._counter.values(), default=1) <= 0:
+                self._most_common = [
+                    (value, count) for value, count in self._most_common if count > 0
+                ]
+        return self._most_common
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -243,9 +255,13 @@ def create_histogram_section(
     """
     if sum(counter.values()) == 0:
         return MISSING_FIGURE_MESSAGE
-    most_common = [
-        (value, count) for value, count in counter.most_common() if count > 0 and value is not None
-    ]
+    most_common = counter.most_common()
+    # The filter is slow on large counters, so it is skipped when there
+    # is nothing to remove.
+    if None in counter or min(counter.values()) <= 0:
+        most_common = [
+            (value, count) for value, count in most_common if count > 0 and value is not None
+        ]
     fig = create_histogram(
         column=column,
         names=[str(value) for value, _ in most_common],
@@ -253,7 +269,7 @@ def create_histogram_section(
         yscale=yscale,
         figsize=figsize,
     )
-    return Template(
+    return compile_template(
         r"""<p style="margin-top: 1rem;">
 <b>Distribution of values in column {{column}}</b>
 
@@ -335,7 +351,7 @@ def create_table(
     if sum(counter.values()) == 0:
         return "<span>&#9888;</span> No table is generated because the column is empty"
 
-    return Template(
+    return compile_template(
         """<details>
     <summary>[show head and tail values]</summary>
 
@@ -13,17 +13,18 @@ import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.cache import get_column_set
 from flamme.utils.figure import figure2html
 
 if TYPE_CHECKING:
@@ -150,7 +151,7 @@ class ColumnTemporalDriftDiscreteSection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the temporal drift of {self._column}")
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -264,7 +265,8 @@ def create_temporal_drift_figure(
 
     ```
     """
-    if frame.is_empty() or column not in frame or dt_column not in frame:
+    columns = get_column_set(frame)
+    if frame.is_empty() or column not in columns or dt_column not in columns:
         return None
 
     fig, _ax = plt.subplots(figsize=figsize)
@@ -9,18 +9,19 @@ import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import bar_discrete_temporal
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.cache import get_column_set
 from flamme.utils.count import compute_temporal_value_counts
 from flamme.utils.figure import figure2html
 
@@ -141,7 +142,7 @@ class ColumnTemporalDiscreteSection(BaseSection):
             f"Analyzing the temporal discrete distribution of {self._column} | "
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -262,7 +263,8 @@ def create_temporal_figure(
 
     ```
     """
-    if frame.is_empty() or column not in frame or dt_column not in frame:
+    columns = get_column_set(frame)
+    if frame.is_empty() or column not in columns or dt_column not in columns:
         return None
 
     counts, steps, values = compute_temporal_value_counts(
@@ -5,16 +5,15 @@ from __future__ import annotations
 
 __all__ = ["DataTypeSection", "create_section_template", "create_table", "create_table_row"]
 
-import copy
 import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -64,13 +63,11 @@ class DataTypeSection(BaseSection):
         self._dtypes = dtypes
         self._types = types
 
-        dtkeys = set(self._dtypes.keys())
-        tkeys = set(self._types.keys())
-        if dtkeys != tkeys:
+        if self._dtypes.keys() != self._types.keys():
             msg = (
                 f"The keys of dtypes and types do not match:\n"
-                f"({len(dtkeys)}): {dtkeys}\n"
-                f"({len(tkeys)}): {tkeys}\n"
+                f"({len(self._dtypes)}) vs ({len(self._types)}) keys\n"
+                f"keys in only one of them: {self._dtypes.keys() ^ self._types.keys()}\n"
             )
             raise RuntimeError(msg)
 
@@ -79,10 +76,10 @@ class DataTypeSection(BaseSection):
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     def get_statistics(self) -> dict:
-        return copy.deepcopy(self._types)
+        return {column: set(types) for column, types in self._types.items()}
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -161,7 +158,7 @@ def create_table(dtypes: dict[str, pl.DataType], types: dict[str, set]) -> str:
     rows = "\n".join(
         [create_table_row(column=col, types=types[col], dtype=dtypes[col]) for col in columns]
     )
-    return Template(
+    return compile_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -201,10 +198,8 @@ def create_table_row(column: str, dtype: pl.DataType, types: set[type]) -> str:
     ```
     """
     types = sorted([str(t).replace("<", "&lt;").replace(">", "&gt;") for t in types])
-    return Template(
-        """<tr>
-    <th>{{column}}</th>
-    <td>{{dtype}}</td>
-    <td>{{types}}</td>
+    return f"""<tr>
+    <th>{column}</th>
+    <td>{dtype}</td>
+    <td>{", ".join(types)}</td>
 </tr>"""
-    ).render({"column": column, "dtype": dtype, "types": ", ".join(types)})
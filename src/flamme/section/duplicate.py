@@ -9,11 +9,11 @@ import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -111,10 +111,10 @@ class DuplicatedRowSection(BaseSection):
         return {"num_rows": self._frame.shape[0], "num_unique_rows": frame_no_duplicate.shape[0]}
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
-        logger.info(f"Rendering the duplicated rows section using the columns: {self._columns}")
+        logger.info("Rendering the duplicated rows section using the columns: %s", self._columns)
         stats = self.get_statistics()
         columns = self._frame.columns if self._columns is None else self._columns
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -187,7 +187,7 @@ def create_duplicate_table(num_rows: int, num_unique_rows: int) -> str:
     num_duplicated_rows = num_rows - num_unique_rows
     pct_unique_rows = num_unique_rows / num_rows if num_rows else float("nan")
     pct_duplicated_rows = 1.0 - pct_unique_rows
-    return Template(
+    return compile_template(
         """
 <table class="table table-hover table-responsive w-auto" >
 <thead class="thead table-group-divider">
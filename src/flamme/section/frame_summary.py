@@ -10,21 +10,25 @@ __all__ = [
     "create_table_row",
 ]
 
+import contextvars
 import logging
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Template
-
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.count import compute_nunique
+from flamme.utils.count import (
+    compute_column_nunique,
+    compute_most_frequent_values,
+    compute_nunique,
+)
 from flamme.utils.null import compute_null_count
 
 if TYPE_CHECKING:
@@ -41,6 +45,11 @@ class DataFrameSummarySection(BaseSection):
     Args:
         frame: The DataFrame to analyze.
         top: The number of most frequent values to show.
+        max_workers: The maximum number of threads used to count
+            the values of the columns. The columns are processed
+            sequentially if this value is ``1``. Most of the polars
+            operations release the GIL, so the columns can be
+            processed concurrently.
 
     Example usage:
 
@@ -67,12 +76,16 @@ class DataFrameSummarySection(BaseSection):
     ```
     """
 
-    def __init__(self, frame: pl.DataFrame, top: int = 5) -> None:
+    def __init__(self, frame: pl.DataFrame, top: int = 5, max_workers: int = 1) -> None:
         self._frame = frame
         if top < 0:
             msg = f"Incorrect top value ({top}). top must be positive"
             raise ValueError(msg)
         self._top = top
+        if max_workers < 1:
+            msg = f"Incorrect max_workers: {max_workers}. max_workers must be greater than 0"
+            raise ValueError(msg)
+        self._max_workers = max_workers
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(top={self._top})"
@@ -99,7 +112,10 @@ class DataFrameSummarySection(BaseSection):
         return tuple(self._frame.schema.dtypes())
 
     def get_most_frequent_values(self, top: int = 5) -> tuple[tuple[tuple[Any, int], ...], ...]:
-        return tuple(tuple(Counter(series.to_list()).most_common(top)) for series in self.frame)
+        return tuple(
+            tuple(compute_most_frequent_values(self._frame, column=column, top=top))
+            for column in self._frame.columns
+        )
 
     def get_statistics(self) -> dict:
         return {
@@ -111,7 +127,7 @@ class DataFrameSummarySection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the DataFrame summary section...")
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -130,15 +146,34 @@ class DataFrameSummarySection(BaseSection):
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
     def _create_table(self) -> str:
+        columns = self._frame.columns
+        if self._max_workers == 1 or len(columns) <= 1:
+            summaries = [self._summarize_column(column) for column in columns]
+        else:
+            # Each column is summarized in a copy of the current context,
+            # so the worker threads share the frame cache scope of the caller.
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(columns))) as executor:
+                summaries = list(
+                    executor.map(
+                        lambda column: context.copy().run(self._summarize_column, column), columns
+                    )
+                )
         return create_table(
             columns=self.get_columns(),
             null_count=self.get_null_count(),
-            nunique=self.get_nunique(),
+            nunique=tuple(nunique for nunique, _ in summaries),
             dtypes=self.get_dtypes(),
-            most_frequent_values=self.get_most_frequent_values(top=self._top),
+            most_frequent_values=tuple(values for _, values in summaries),
             total=self._frame.shape[0],
         )
 
+    def _summarize_column(self, column: str) -> tuple[int, tuple[tuple[Any, int], ...]]:
+        return (
+            compute_column_nunique(self._frame, column=column),
+            tuple(compute_most_frequent_values(self._frame, column=column, top=self._top)),
+        )
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -246,7 +281,7 @@ def create_table(
             )
         )
     rows = "\n".join(rows)
-    return Template(
+    return compile_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -309,21 +344,11 @@ def create_table_row(
     most_frequent_values = ", ".join(
         [f"{val} ({100 * c / total:.2f}%)" for val, c in most_frequent_values]
     )
-    return Template(
-        """<tr>
-    <th>{{column}}</th>
-    <td>{{dtype}}</td>
-    <td {{num_style}}>{{null}}</td>
-    <td {{num_style}}>{{nunique}}</td>
-    <td>{{most_frequent_values}}</td>
+    num_style = 'style="text-align: right;"'
+    return f"""<tr>
+    <th>{column}</th>
+    <td>{dtype}</td>
+    <td {num_style}>{null}</td>
+    <td {num_style}>{nunique}</td>
+    <td>{most_frequent_values}</td>
 </tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "column": column,
-            "null": null,
-            "dtype": dtype,
-            "nunique": nunique,
-            "most_frequent_values": most_frequent_values,
-        }
-    )
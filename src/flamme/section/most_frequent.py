@@ -10,15 +10,17 @@ __all__ = [
     "create_table_row",
 ]
 
+import heapq
 import logging
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -89,7 +91,7 @@ class MostFrequentValuesSection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the most frequent values section...")
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -168,13 +170,21 @@ def create_frequent_values_table(counter: Counter, top: int = 100, reverse: bool
     ```
     """
     total = sum(counter.values())
-    most_common = counter.most_common()[-top:][::-1] if reverse else counter.most_common(top)
+    if reverse and top > 0 and len(counter) > 4 * top:
+        # Same order as ``counter.most_common()[-top:][::-1]`` without
+        # sorting all the values. The heap is slower than the sort for
+        # small counters.
+        most_common = heapq.nsmallest(top, reversed(counter.items()), key=itemgetter(1))
+    elif reverse:
+        most_common = counter.most_common()[-top:][::-1]
+    else:
+        most_common = counter.most_common(top)
     rows = []
     cumcount = 0
     for value, count in most_common:
         cumcount += count
         rows.append(create_table_row(value=value, count=count, total=total, cumcount=cumcount))
-    return Template(
+    return compile_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -216,19 +226,10 @@ def create_table_row(value: str, count: int, total: int, cumcount: int) -> str:
     """
     pct = 100 * count / total if total > 0 else float("nan")
     cum_percentage = 100 * cumcount / total if total > 0 else float("nan")
-    return Template(
-        """<tr>
-    <th>{{value}}</th>
-    <td {{num_style}}>{{count}}</td>
-    <td {{num_style}}>{{percentage}}</td>
-    <td {{num_style}}>{{cum_percentage}}</td>
+    num_style = 'style="text-align: right;"'
+    return f"""<tr>
+    <th>{value}</th>
+    <td {num_style}>{count:,}</td>
+    <td {num_style}>{pct:.2f}</td>
+    <td {num_style}>{cum_percentage:.2f}</td>
 </tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "value": value,
-            "count": f"{count:,}",
-            "percentage": f"{pct:.2f}",
-            "cum_percentage": f"{cum_percentage:.2f}",
-        }
-    )
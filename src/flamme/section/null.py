@@ -12,17 +12,19 @@ __all__ = [
 ]
 
 import logging
+import math
 from typing import TYPE_CHECKING
 
+import numpy as np
 import polars as pl
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -33,9 +35,6 @@ from flamme.utils.figure import figure2html
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import numpy as np
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -144,7 +143,7 @@ class NullValueSection(BaseSection):
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the null value distribution of all columns...")
         frame = self._get_dataframe()
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -275,7 +274,18 @@ def create_bar_figure(
         return None
 
     fig, ax = plt.subplots(figsize=figsize)
-    ax.bar(x=columns, height=null_count, color="tab:blue")
+    x = np.arange(len(columns))
+    if len(columns) < 50:
+        ax.bar(x=x, height=null_count, color="tab:blue")
+    else:
+        # One patch per bar is slow to create and to draw for wide
+        # DataFrames, so the contiguous bars are drawn as a single
+        # artist.
+        ax.stairs(null_count, np.arange(len(columns) + 1) - 0.5, fill=True, color="tab:blue")
+    # Only the ticks kept by readable_xticklabels are created because
+    # creating one tick per column is slow for wide DataFrames.
+    step = math.ceil(len(columns) / 100)
+    ax.set_xticks(x[::step], labels=columns[::step])
     ax.set_xlim(-0.5, len(columns) - 0.5)
     readable_xticklabels(ax, max_num_xticks=100)
     ax.set_xlabel("column")
@@ -317,7 +327,7 @@ def create_table(frame: pl.DataFrame) -> str:
             frame["total"],
         )
     ]
-    return Template(
+    return compile_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -358,21 +368,10 @@ def create_table_row(column: str, null_count: int, total_count: int) -> str:
     """
     pct = null_count / total_count if total_count > 0 else float("nan")
     pct_color = pct if total_count > 0 else 0
-    return Template(
-        """<tr>
-    <th style="background-color: rgba(0, 191, 255, {{null_pct}})">{{column}}</th>
-    <td {{num_style}}>{{null_pct}}</td>
-    <td {{num_style}}>{{null_count}}</td>
-    <td {{num_style}}>{{total_count}}</td>
+    num_style = f'style="text-align: right; background-color: rgba(0, 191, 255, {pct_color})"'
+    return f"""<tr>
+    <th style="background-color: rgba(0, 191, 255, {pct:.4f})">{column}</th>
+    <td {num_style}>{pct:.4f}</td>
+    <td {num_style}>{null_count:,}</td>
+    <td {num_style}>{total_count:,}</td>
 </tr>"""
-    ).render(
-        {
-            "num_style": (
-                f'style="text-align: right; background-color: rgba(0, 191, 255, {pct_color})"'
-            ),
-            "column": column,
-            "null_count": f"{null_count:,}",
-            "null_pct": f"{pct:.4f}",
-            "total_count": f"{total_count:,}",
-        }
-    )
@@ -15,7 +15,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import plot_null_temporal
@@ -23,11 +22,13 @@ from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.cache import get_column_set
 from flamme.utils.figure import figure2html
 from flamme.utils.null import compute_temporal_null_count
 
@@ -102,7 +103,7 @@ class TemporalNullValueSection(BaseSection):
         period: str,
         figsize: tuple[float, float] | None = None,
     ) -> None:
-        if dt_column not in frame:
+        if dt_column not in get_column_set(frame):
             msg = (
                 f"Datetime column {dt_column} is not in the DataFrame "
                 f"(columns:{sorted(frame.columns)})"
@@ -164,7 +165,7 @@ class TemporalNullValueSection(BaseSection):
             "Rendering the temporal distribution of null values for all columns "
             f"| datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -342,10 +343,11 @@ def create_temporal_null_table(
     nulls, totals, labels = compute_temporal_null_count(
         frame=frame, columns=columns, dt_column=dt_column, period=period
     )
-    rows = []
-    for label, null, total in zip(labels, nulls, totals):
-        rows.append(create_temporal_null_table_row(label=label, num_nulls=null, total=total))
-    return Template(
+    rows = [
+        create_temporal_null_table_row(label=label, num_nulls=null, total=total)
+        for label, null, total in zip(labels, nulls, totals)
+    ]
+    return compile_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -393,23 +395,12 @@ def create_temporal_null_table_row(label: str, num_nulls: int, total: int) -> st
     ```
     """
     num_non_nulls = total - num_nulls
-    return Template(
-        """<tr>
-    <th>{{label}}</th>
-    <td {{num_style}}>{{num_nulls}}</td>
-    <td {{num_style}}>{{num_non_nulls}}</td>
-    <td {{num_style}}>{{total}}</td>
-    <td {{num_style}}>{{num_nulls_pct}}</td>
-    <td {{num_style}}>{{num_non_nulls_pct}}</td>
+    num_style = 'style="text-align: right;"'
+    return f"""<tr>
+    <th>{label}</th>
+    <td {num_style}>{num_nulls:,}</td>
+    <td {num_style}>{num_non_nulls:,}</td>
+    <td {num_style}>{total:,}</td>
+    <td {num_style}>{100 * num_nulls / total:.2f}%</td>
+    <td {num_style}>{100 * num_non_nulls / total:.2f}%</td>
 </tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "label": label,
-            "num_nulls": f"{num_nulls:,}",
-            "num_non_nulls": f"{num_non_nulls:,}",
-            "total": f"{total:,}",
-            "num_nulls_pct": f"{100 * num_nulls / total:.2f}%",
-            "num_non_nulls_pct": f"{100 * num_non_nulls / total:.2f}%",
-        }
-    )
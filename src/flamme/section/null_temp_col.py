@@ -18,7 +18,6 @@ from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping, str_indent
 from grizz.utils.imports import is_tqdm_available
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import plot_null_temporal
@@ -26,6 +25,7 @@ from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    compile_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -173,10 +173,13 @@ class ColumnTemporalNullValueSection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(
-            f"Rendering the temporal null value distribution of the following columns: "
-            f"{self._columns}\ndatetime column: {self._dt_column} | period: {self._period}"
+            "Rendering the temporal null value distribution of the following columns: "
+            "%s\ndatetime column: %s | period: %s",
+            self._columns,
+            self._dt_column,
+            self._period,
         )
-        return Template(create_section_template()).render(
+        return compile_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -303,7 +306,7 @@ def create_temporal_null_figure(
         frame=frame, columns=columns, dt_column=dt_column, period=period, figsize=figsize
     )
     figures = add_column_to_figure(columns=columns, figures=figures)
-    return Template(
+    return compile_template(
         """<div class="container-fluid text-center">
   <div class="row align-items-start">
     {{columns}}
@@ -504,7 +507,7 @@ def create_table_section(
             frame=frame, column=column, dt_column=dt_column, period=period
         )
         tables.append(f'<p style="margin-top: 1rem;">\n\n{table}\n')
-    return Template(
+    return compile_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -575,7 +578,7 @@ def create_temporal_null_table(
         create_temporal_null_table_row(label=label, null=null, total=total)
         for label, null, total in zip(labels, nulls, totals)
     ]
-    return Template(
+    return compile_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -620,23 +623,12 @@ def create_temporal_null_table_row(label: str, null: int, total: int) -> str:
     ```
     """
     non_null = total - null
-    return Template(
-        """<tr>
-    <th>{{label}}</th>
-    <td {{num_style}}>{{null}}</td>
-    <td {{num_style}}>{{non_null}}</td>
-    <td {{num_style}}>{{total}}</td>
-    <td {{num_style}}>{{nulls_pct}}</td>
-    <td {{num_style}}>{{non_null_pct}}</td>
+    num_style = 'style="text-align: right;"'
+    return f"""<tr>
+    <th>{label}</th>
+    <td {num_style}>{null:,}</td>
+    <td {num_style}>{non_null:,}</td>
+    <td {num_style}>{total:,}</td>
+    <td {num_style}>{100 * null / total:.2f}%</td>
+    <td {num_style}>{100 * non_null / total:.2f}%</td>
 </tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "label": label,
-            "nulls": f"{null:,}",
-            "non_null": f"{non_null:,}",
-            "total": f"{total:,}",
-            "nulls_pct": f"{100 * null / total:.2f}%",
-            "non_null_pct": f"{100 * non_null / total:.2f}%",
-        }
-    )
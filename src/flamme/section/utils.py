@@ -4,20 +4,55 @@ from __future__ import annotations
 
 __all__ = [
     "GO_TO_TOP",
+    "compile_template",
     "render_html_toc",
     "tags2id",
     "tags2title",
     "valid_h_tag",
 ]
 
+import functools
 from typing import TYPE_CHECKING
 
+from jinja2 import Template
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 GO_TO_TOP = '<a href="#">Go to top</a>'
 
 
+@functools.lru_cache(maxsize=128)
+def compile_template(source: str) -> Template:
+    r"""Compile a Jinja2 template.
+
+    The compiled templates of the last 128 source strings are
+    cached, so a template used to render many sections or rows is
+    parsed only once.
+
+    Args:
+        source: The template source.
+
+    Returns:
+        The compiled template.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.section.utils import compile_template
+    >>> template = compile_template("<p>{{text}}</p>")
+    >>> out = template.render({"text": "meow"})
+    >>> out
+    <p>meow</p>
+    >>> compile_template("<p>{{text}}</p>") is template
+    True
+
+    ```
+    """
+    return Template(source)
+
+
 def tags2id(tags: Sequence[str]) -> str:
     r"""Convert a sequence of tags to a string that can be used as ID in
     a HTML file.
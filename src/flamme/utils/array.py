@@ -93,5 +93,5 @@ def rand_replace(
     """
     if rng is None:
         rng = np.random.default_rng()
-    mask = rng.choice([True, False], size=arr.shape, p=[prob, 1.0 - prob])
+    mask = rng.random(size=arr.shape) < prob
     return np.where(mask, value, arr)
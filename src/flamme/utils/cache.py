@@ -0,0 +1,303 @@
+r"""Contain utility functions to cache intermediate results computed on
+a DataFrame.
+
+The same DataFrame is usually analyzed by several analyzers and
+sections, so some intermediate results (e.g. the number of null or
+unique values per column) are computed multiple times. The functions
+in this module store these results in a cache associated to the
+DataFrame object. The results are only cached inside a
+``frame_cache_scope`` context, which is entered by the reporters, and
+the cache is released when leaving the context. The DataFrame must not
+be modified in-place inside the context.
+"""
+
+from __future__ import annotations
+
+__all__ = ["frame_cache", "frame_cache_scope", "get_column_set", "get_frame_cache"]
+
+import contextlib
+import functools
+import weakref
+from collections import Counter
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Generator
+
+T = TypeVar("T")
+
+
+class _ScopeCache:
+    r"""Store the caches of the DataFrames used inside a
+    ``frame_cache_scope`` context."""
+
+    def __init__(self) -> None:
+        self.caches: dict[int, dict] = {}
+        self.finalizers: list[weakref.finalize] = []
+
+    def release(self) -> None:
+        r"""Release the caches of all the DataFrames."""
+        for finalizer in self.finalizers:
+            finalizer.detach()
+        self.finalizers.clear()
+        self.caches.clear()
+
+
+_SCOPE_CACHE: ContextVar[_ScopeCache | None] = ContextVar("frame_cache_scope", default=None)
+
+
+def get_frame_cache(frame: pl.DataFrame) -> dict:
+    r"""Return the cache associated to a DataFrame.
+
+    Inside a ``frame_cache_scope`` context, the cache is created the
+    first time this function is called for a DataFrame, and is
+    released when leaving the context or when the DataFrame is
+    garbage collected. Outside a ``frame_cache_scope`` context, a new
+    empty cache is returned at each call, so nothing is cached.
+
+    Args:
+        frame: The DataFrame.
+
+    Returns:
+        The cache associated to the DataFrame.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.cache import frame_cache_scope, get_frame_cache
+    >>> frame = pl.DataFrame({"col": [1, 2, 3]})
+    >>> with frame_cache_scope():
+    ...     cache = get_frame_cache(frame)
+    ...     cache is get_frame_cache(frame)
+    ...
+    True
+    >>> get_frame_cache(frame) is get_frame_cache(frame)
+    False
+
+    ```
+    """
+    scope = _SCOPE_CACHE.get()
+    if scope is None:
+        return {}
+    key = id(frame)
+    cache = scope.caches.get(key)
+    if cache is None:
+        # setdefault is atomic, so the threads that analyze the same
+        # DataFrame share the same cache.
+        new_cache: dict = {}
+        cache = scope.caches.setdefault(key, new_cache)
+        if cache is new_cache:
+            scope.finalizers.append(weakref.finalize(frame, scope.caches.pop, key, None))
+    return cache
+
+
+@contextlib.contextmanager
+def frame_cache_scope() -> Generator[None, None, None]:
+    r"""Implement a context manager to cache the intermediate results
+    computed on DataFrames.
+
+    The functions decorated with ``frame_cache`` only cache their
+    output inside this context. The cache is stored in a context
+    variable, so it is not shared with the other threads unless they
+    run in a copy of the current context (e.g. with
+    ``contextvars.copy_context``). A nested context reuses the cache
+    of the outer context, and the cached values are released when
+    leaving the outermost context.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.cache import frame_cache_scope, get_column_set
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    >>> with frame_cache_scope():
+    ...     get_column_set(frame) is get_column_set(frame)
+    ...
+    True
+
+    ```
+    """
+    if _SCOPE_CACHE.get() is not None:
+        yield
+        return
+    scope = _ScopeCache()
+    token = _SCOPE_CACHE.set(scope)
+    try:
+        yield
+    finally:
+        _SCOPE_CACHE.reset(token)
+        scope.release()
+
+
+def frame_cache(func: Callable[..., T]) -> Callable[..., T]:
+    r"""Cache the output of a function whose first argument is a
+    DataFrame.
+
+    The output is cached per DataFrame object and per value of the
+    other arguments, and only inside a ``frame_cache_scope`` context.
+    The call is not cached if the other arguments are not hashable.
+    Lists are converted to tuples before hashing. The cached numpy
+    arrays, including the arrays in a cached tuple or list, are
+    read-only because they are shared by all the callers. The
+    returned lists, dictionaries, counters and DataFrames are
+    shallow copies of the cached values, so they can be modified by
+    the caller. The output is returned unchanged when it is not
+    cached.
+
+    Args:
+        func: The function to cache.
+
+    Returns:
+        The wrapped function.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> import polars as pl
+    >>> from flamme.utils.cache import frame_cache, frame_cache_scope
+    >>> @frame_cache
+    ... def compute_sum(frame: pl.DataFrame) -> np.ndarray:
+    ...     return frame.sum().to_numpy()[0]
+    ...
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": [4, 5, 6]})
+    >>> with frame_cache_scope():
+    ...     out = compute_sum(frame)
+    ...     compute_sum(frame) is out
+    ...
+    True
+    >>> out
+    array([ 6, 15])
+
+    ```
+    """
+
+    @functools.wraps(func)
+    def wrapper(frame: pl.DataFrame, *args: Any, **kwargs: Any) -> T:
+        if _SCOPE_CACHE.get() is None:
+            return func(frame, *args, **kwargs)
+        key = (
+            func.__module__,
+            func.__qualname__,
+            tuple(_to_hashable(arg) for arg in args),
+            tuple(sorted((name, _to_hashable(value)) for name, value in kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return func(frame, *args, **kwargs)
+        cache = get_frame_cache(frame)
+        if key not in cache:
+            cache[key] = _freeze_arrays(func(frame, *args, **kwargs))
+        return _copy_containers(cache[key])
+
+    return wrapper
+
+
+def get_column_set(frame: pl.DataFrame) -> Collection[str]:
+    r"""Return the column names of a DataFrame, to check if a column is
+    in the DataFrame.
+
+    ``column in frame`` builds the list of all the column names at
+    each call, so this function should be used to check if a column
+    is in a wide DataFrame. Inside a ``frame_cache_scope`` context,
+    the column names are stored in a set that is cached for each
+    DataFrame. Outside a ``frame_cache_scope`` context, the list of
+    column names is returned, so no set is built for a single check.
+
+    Args:
+        frame: The DataFrame.
+
+    Returns:
+        The column names.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.cache import get_column_set
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    >>> sorted(get_column_set(frame))
+    ['col1', 'col2']
+    >>> "col1" in get_column_set(frame)
+    True
+
+    ```
+    """
+    if _SCOPE_CACHE.get() is None:
+        return frame.columns
+    return _get_column_frozenset(frame)
+
+
+@frame_cache
+def _get_column_frozenset(frame: pl.DataFrame) -> frozenset[str]:
+    r"""Return the set of column names of a DataFrame.
+
+    Args:
+        frame: The DataFrame.
+
+    Returns:
+        The set of column names.
+    """
+    return frozenset(frame.columns)
+
+
+def _to_hashable(value: Any) -> Any:
+    r"""Convert a list to a tuple so it can be used in a cache key.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The converted value.
+    """
+    if isinstance(value, list):
+        return tuple(_to_hashable(v) for v in value)
+    return value
+
+
+def _copy_containers(value: Any) -> Any:
+    r"""Return a shallow copy of the mutable containers of a cached
+    value.
+
+    Args:
+        value: The cached value. The items of a tuple are copied
+            one by one.
+
+    Returns:
+        The copied value.
+    """
+    if isinstance(value, tuple):
+        return tuple(_copy_containers(v) for v in value)
+    if isinstance(value, (list, dict, Counter)):
+        return value.copy()
+    if isinstance(value, pl.DataFrame):
+        return value.clone()
+    return value
+
+
+def _freeze_arrays(value: T) -> T:
+    r"""Make read-only the numpy arrays of a value.
+
+    Args:
+        value: The value. The numpy arrays in a tuple or a list are
+            also made read-only.
+
+    Returns:
+        The input value.
+    """
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze_arrays(item)
+    return value
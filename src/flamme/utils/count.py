@@ -2,15 +2,133 @@ r"""Contain utility functions for counting."""
 
 from __future__ import annotations
 
-__all__ = ["compute_nunique", "compute_temporal_count", "compute_temporal_value_counts"]
+__all__ = [
+    "compute_column_nunique",
+    "compute_column_value_counts",
+    "compute_most_frequent_values",
+    "compute_nunique",
+    "compute_temporal_count",
+    "compute_temporal_value_counts",
+    "compute_value_counts",
+]
+
+from collections import Counter
+from typing import Any
 
 import numpy as np
 import polars as pl
 
+from flamme.utils.cache import frame_cache
 from flamme.utils.sorting import mixed_typed_sort
-from flamme.utils.temporal import to_step_names
+from flamme.utils.temporal import compute_step_index
+
+
+def compute_column_nunique(frame: pl.DataFrame, column: str) -> int:
+    r"""Return the number of unique values in a column of a DataFrame.
+
+    The number of unique values is the number of rows of the cached
+    value counts of the column, so the values are not hashed again
+    if the value counts were already computed.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze.
+
+    Returns:
+        The number of unique values. The null value is counted as a
+            value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_column_nunique
+    >>> frame = pl.DataFrame({"col": ["A", None, "B", "A"]})
+    >>> compute_column_nunique(frame, column="col")
+    3
+
+    ```
+    """
+    return _compute_column_value_count_frame(frame, column).height
+
+
+def compute_column_value_counts(frame: pl.DataFrame, column: str) -> Counter:
+    r"""Return the number of occurrences of each value in a column of a
+    DataFrame.
+
+    The polars value counts are cached for each DataFrame inside a
+    ``frame_cache_scope`` context, so the values of a column are
+    hashed only once even if several analyzers count them. The counter is built at each call, so it
+    can be modified by the caller.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze.
+
+    Returns:
+        A counter with the number of occurrences of each value.
+            The values are stored by order of first occurrence.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_column_value_counts
+    >>> frame = pl.DataFrame({"col": ["A", None, "B", "A"]})
+    >>> counter = compute_column_value_counts(frame, column="col")
+    >>> counter
+    Counter({'A': 2, None: 1, 'B': 1})
+
+    ```
+    """
+    series = frame[column]
+    if series.dtype == pl.Boolean:
+        return _compute_boolean_value_counts(series)
+    return _to_counter(_compute_column_value_count_frame(frame, column))
+
+
+def compute_most_frequent_values(
+    frame: pl.DataFrame, column: str, top: int = 5
+) -> list[tuple[Any, int]]:
+    r"""Return the most frequent values in a column of a DataFrame.
+
+    The values are sorted by polars, so only the ``top`` most frequent
+    values are converted to Python objects. This is much faster than
+    ``Counter.most_common`` for columns with many unique values.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze.
+        top: The maximum number of values to return.
+
+    Returns:
+        The list of ``(value, count)`` tuples sorted by decreasing
+            count. The values with the same count are sorted by order
+            of first occurrence, like ``Counter.most_common``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_most_frequent_values
+    >>> frame = pl.DataFrame({"col": ["A", None, "B", "A", "C", "B", "A"]})
+    >>> compute_most_frequent_values(frame, column="col", top=2)
+    [('A', 3), ('B', 2)]
+
+    ```
+    """
+    counts = (
+        _compute_column_value_count_frame(frame, column)
+        .sort("count", descending=True, maintain_order=True)
+        .head(top)
+    )
+    return list(zip(counts["value"].to_list(), counts["count"].to_list()))
 
 
+@frame_cache
 def compute_nunique(frame: pl.DataFrame) -> np.ndarray:
     r"""Return the number of unique values in each column.
 
@@ -20,6 +138,8 @@ def compute_nunique(frame: pl.DataFrame) -> np.ndarray:
     Returns:
         An array with the number of unique values in each column.
             The shape of the array is the number of columns.
+            The output is cached for each DataFrame inside a
+            ``frame_cache_scope`` context, so the array is read-only.
 
     Example usage:
 
@@ -102,13 +222,8 @@ def compute_temporal_count(
     if frame.is_empty():
         return np.array([], dtype=np.int64), []
 
-    groups = (
-        frame.select(pl.col(dt_column).alias("datetime"), pl.lit(1).alias("count"))
-        .sort("datetime")
-        .group_by_dynamic("datetime", every=period)
-    )
-    steps = to_step_names(groups=groups, period=period)
-    counts = groups.agg(pl.col("count").sum())["count"].to_numpy().astype(np.int64)
+    index, steps = compute_step_index(frame=frame, dt_column=dt_column, period=period)
+    counts = np.bincount(index[index >= 0], minlength=len(steps)).astype(np.int64)
     return counts, steps
 
 
@@ -184,19 +299,128 @@ def compute_temporal_value_counts(
     if frame.is_empty():
         return np.zeros((0, 0), dtype=np.int64), [], []
 
-    frame = frame.select(pl.col(dt_column).alias("__datetime__"), pl.col(column).alias("value"))
+    index, steps = compute_step_index(frame=frame, dt_column=dt_column, period=period)
+    frame_counts = (
+        pl.DataFrame({"step": index, "value": frame[column]})
+        .filter(pl.col("step") >= 0)
+        .group_by("step", "value")
+        .len()
+    )
+    if drop_nulls:
+        frame_counts = frame_counts.drop_nulls("value")
+    names = frame_counts["value"].cast(pl.String).fill_null("null")
+    values = mixed_typed_sort(names.unique().to_list())
+    positions = {value: i for i, value in enumerate(values)}
+    counts = np.zeros((len(values), len(steps)), dtype=np.int64)
+    rows = [positions[name] for name in names]
+    # The null value and the string "null" have the same name, so their
+    # counts are added instead of being assigned.
+    np.add.at(counts, (rows, frame_counts["step"].to_numpy()), frame_counts["len"].to_numpy())
     if drop_nulls:
-        frame = frame.drop_nulls()
+        # The temporal windows that contain only null values are removed.
+        valid = counts.sum(axis=0) > 0
+        counts = counts[:, valid]
+        steps = [step for step, keep in zip(steps, valid) if keep]
+    return counts, steps, values
 
-    groups = frame.sort(["__datetime__", "value"]).group_by_dynamic("__datetime__", every=period)
-    steps = to_step_names(groups=groups, period="1mo")
-    frame_counts = (
-        groups.agg(pl.col("value").value_counts())
-        .explode("value")
-        .unnest("value")
-        .pivot(on="value", index="__datetime__", values="count")
-        .drop("__datetime__")
+
+def compute_value_counts(series: pl.Series) -> Counter:
+    r"""Return the number of occurrences of each value in a series.
+
+    The values are counted by polars, so only one Python object is
+    created per unique value instead of one per row. The values are
+    stored by order of first occurrence. Boolean series are counted
+    with reductions because there are at most 3 unique values.
+
+    Args:
+        series: The series to analyze.
+
+    Returns:
+        A counter with the number of occurrences of each value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_value_counts
+    >>> counter = compute_value_counts(pl.Series([None, 1, 0, 1]))
+    >>> counter
+    Counter({1: 2, None: 1, 0: 1})
+
+    ```
+    """
+    if series.dtype == pl.Boolean:
+        return _compute_boolean_value_counts(series)
+    return _to_counter(_count_values(series))
+
+
+def _compute_boolean_value_counts(series: pl.Series) -> Counter:
+    r"""Return the number of occurrences of each value in a boolean
+    series.
+
+    Args:
+        series: The boolean series to analyze.
+
+    Returns:
+        A counter with the number of occurrences of each value.
+            The values are stored by order of first occurrence.
+    """
+    num_nulls = series.null_count()
+    num_trues = series.sum()
+    num_falses = series.len() - num_nulls - num_trues
+    counts = []
+    if num_trues:
+        counts.append((series.fill_null(value=False).arg_max(), True, num_trues))
+    if num_falses:
+        counts.append((series.fill_null(value=True).arg_min(), False, num_falses))
+    if num_nulls:
+        counts.append((series.is_null().arg_max(), None, num_nulls))
+    return Counter({value: count for _, value, count in sorted(counts)})
+
+
+@frame_cache
+def _compute_column_value_count_frame(frame: pl.DataFrame, column: str) -> pl.DataFrame:
+    r"""Return the cached number of occurrences of each value in a
+    column of a DataFrame.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze.
+
+    Returns:
+        A DataFrame with the columns ``value`` and ``count``.
+            The values are stored by order of first occurrence.
+    """
+    return _count_values(frame[column])
+
+
+def _count_values(series: pl.Series) -> pl.DataFrame:
+    r"""Return the number of occurrences of each value in a series.
+
+    Args:
+        series: The series to analyze.
+
+    Returns:
+        A DataFrame with the columns ``value`` and ``count``.
+            The values are stored by order of first occurrence.
+    """
+    return (
+        series.alias("value")
+        .to_frame()
+        .group_by("value", maintain_order=True)
+        .agg(pl.len().alias("count"))
     )
-    frame_counts = frame_counts.select(mixed_typed_sort(frame_counts.columns))
-    counts = frame_counts.fill_null(0.0).to_numpy().astype(np.int64).transpose()
-    return counts, steps, list(frame_counts.columns)
+
+
+def _to_counter(counts: pl.DataFrame) -> Counter:
+    r"""Convert a DataFrame of value counts to a counter.
+
+    Args:
+        counts: The DataFrame with the columns ``value`` and
+            ``count``.
+
+    Returns:
+        A counter with the number of occurrences of each value.
+    """
+    return Counter(dict(zip(counts["value"].to_list(), counts["count"].to_list())))
@@ -8,11 +8,8 @@ __all__ = [
 ]
 
 import logging
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    import polars as pl
 
+import polars as pl
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +66,14 @@ def series_types(series: pl.Series) -> set[type]:
 
     ```
     """
-    return {type(x) for x in series.to_list()}
+    if series.dtype == pl.Object:
+        return {type(x) for x in series.to_list()}
+    # The non-null values of the other data types are converted to the
+    # same Python type, so only the first one needs to be checked.
+    types = {type(x) for x in series.drop_nulls().head(1).to_list()}
+    if series.null_count() > 0:
+        types.add(type(None))
+    return types
 
 
 TYPE_NAMES = {}
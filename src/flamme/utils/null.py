@@ -10,7 +10,8 @@ import numpy as np
 import polars as pl
 import polars.selectors as cs
 
-from flamme.utils.temporal import to_step_names
+from flamme.utils.cache import frame_cache
+from flamme.utils.temporal import compute_step_index
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -71,6 +72,7 @@ def compute_null(frame: pl.DataFrame) -> pl.DataFrame:
     )
 
 
+@frame_cache
 def compute_null_count(frame: pl.DataFrame) -> np.ndarray:
     r"""Return the number of null values in each column.
 
@@ -80,6 +82,8 @@ def compute_null_count(frame: pl.DataFrame) -> np.ndarray:
     Returns:
         An array with the number of null values in each column.
             The shape of the array is the number of columns.
+            The output is cached for each DataFrame inside a
+            ``frame_cache_scope`` context, so the array is read-only.
 
     Example usage:
 
@@ -106,6 +110,7 @@ def compute_null_count(frame: pl.DataFrame) -> np.ndarray:
     return frame.null_count().to_numpy()[0].astype(int)
 
 
+@frame_cache
 def compute_temporal_null_count(
     frame: pl.DataFrame,
     columns: Sequence[str],
@@ -126,7 +131,10 @@ def compute_temporal_null_count(
             that contains the number of null values per period. The
             second value is a numpy NDArray that contains the total
             number of values. The third value is a list that contains
-            the label of each period.
+            the label of each period. The output is cached for each
+            DataFrame inside a ``frame_cache_scope`` context, so the
+            figure and the table of a section share the same counts
+            and the arrays are read-only.
 
     Example usage:
 
@@ -166,15 +174,15 @@ def compute_temporal_null_count(
 
     ```
     """
-    frame_na = frame.select(cs.by_name(columns).is_null().cast(pl.Int64), pl.col(dt_column))
-    groups = frame_na.sort(dt_column).group_by_dynamic(dt_column, every=period)
-    steps = to_step_names(groups=groups, period=period)
-
+    index, steps = compute_step_index(frame=frame, dt_column=dt_column, period=period)
+    valid = index >= 0
     nulls = np.zeros(len(steps), dtype=np.int64)
     totals = np.zeros(len(steps), dtype=np.int64)
     if columns:
-        nulls += groups.agg(cs.by_name(columns).sum()).drop(dt_column).sum_horizontal().to_numpy()
-        totals += (
-            groups.agg(cs.by_name(columns).count()).drop(dt_column).sum_horizontal().to_numpy()
+        row_nulls = (
+            frame.select(pl.sum_horizontal(cs.by_name(columns).is_null())).to_series().to_numpy()
         )
+        counts = np.bincount(index[valid], weights=row_nulls[valid], minlength=len(steps))
+        nulls += counts.astype(np.int64)
+        totals += np.bincount(index[valid], minlength=len(steps)) * len(columns)
     return nulls, totals, steps
@@ -50,11 +50,12 @@ def find_range(
     if xmax is None:
         xmax = np.nanmax(values).item()
     q = [float(x[1:]) for x in [xmin, xmax] if isinstance(x, str)]
-    quantiles = np.nanquantile(values, q)
-    if isinstance(xmin, str):
-        xmin = quantiles[0]
-    if isinstance(xmax, str):
-        xmax = quantiles[-1]
+    if q:
+        quantiles = np.nanquantile(values, q)
+        if isinstance(xmin, str):
+            xmin = quantiles[0]
+        if isinstance(xmax, str):
+            xmax = quantiles[-1]
     if isinstance(xmin, np.number):
         xmin = xmin.item()
     if isinstance(xmax, np.number):
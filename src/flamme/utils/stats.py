@@ -13,7 +13,6 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import polars as pl
-from scipy.stats import kurtosis, skew
 
 from flamme.utils.array import nonnan
 
@@ -107,6 +106,10 @@ def compute_statistics_continuous_array(array: np.ndarray) -> dict[str, float]:
             "<0": 0,
             "=0": 0,
         }
+    # scipy.stats is slow to import, so it is only imported when it is
+    # needed.
+    from scipy.stats import kurtosis, skew  # noqa: PLC0415
+
     quantiles = quantile(
         array_nonnan, q=[0.001, 0.01, 0.05, 0.1, 0.25, 0.75, 0.9, 0.95, 0.99, 0.999]
     )
@@ -2,12 +2,85 @@ r"""Contain utility functions to do temporal transformations."""
 
 from __future__ import annotations
 
-__all__ = ["compute_temporal_stats", "to_step_names", "to_temporal_frames"]
-
+__all__ = [
+    "compute_step_index",
+    "compute_temporal_stats",
+    "to_step_names",
+    "to_temporal_arrays",
+    "to_temporal_frames",
+]
 
+import numpy as np
 import polars as pl
 from grizz.utils.interval import interval_to_strftime_format
 
+from flamme.utils.cache import frame_cache
+
+
+@frame_cache
+def compute_step_index(
+    frame: pl.DataFrame, dt_column: str, period: str
+) -> tuple[np.ndarray, list[str]]:
+    r"""Return the index of the temporal window of each row and the
+    name of each temporal window.
+
+    The temporal windows are the same as the windows created by
+    ``group_by_dynamic(dt_column, every=period)`` on the sorted
+    DataFrame. The output is cached for each DataFrame inside a
+    ``frame_cache_scope`` context, so the temporal windows are
+    computed only once for a given datetime column and period.
+
+    Args:
+        frame: The DataFrame to analyze.
+        dt_column: The datetime column used to create the temporal
+            windows.
+        period: The temporal period e.g. monthly or daily.
+
+    Returns:
+        A tuple with 2 items. The first item is a read-only 1-d array
+            with the index of the temporal window of each row.
+            The index is ``-1`` if the datetime value is null.
+            The second item is the list of temporal window names.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.temporal import compute_step_index
+    >>> index, steps = compute_step_index(
+    ...     frame=pl.DataFrame(
+    ...         {
+    ...             "col": [1.2, 4.2, 0.0, 1.0],
+    ...             "datetime": [
+    ...                 datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+    ...             ],
+    ...         },
+    ...         schema={
+    ...             "col": pl.Float64,
+    ...             "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    ...         },
+    ...     ),
+    ...     dt_column="datetime",
+    ...     period="1mo",
+    ... )
+    >>> index
+    array([1, 0, 0, 2])
+    >>> steps
+    ['2020-01', '2020-03', '2020-04']
+
+    ```
+    """
+    windows = frame[dt_column].dt.truncate(period)
+    index = (windows.rank("dense") - 1).fill_null(-1).cast(pl.Int64).to_numpy()
+    format_dt = interval_to_strftime_format(period)
+    steps = [step.strftime(format_dt) for step in windows.drop_nulls().unique().sort()]
+    return index, steps
+
 
 def compute_temporal_stats(
     frame: pl.DataFrame,
@@ -71,6 +144,9 @@ def compute_temporal_stats(
 
     ```
     """
+    # The quantiles are computed on the non-null values because the
+    # grouped quantiles are much slower when the group contains nulls.
+    values = pl.col(column).drop_nulls()
     return (
         frame.select(column, dt_column)
         .sort(dt_column)
@@ -81,21 +157,93 @@ def compute_temporal_stats(
             pl.col(column).mean().cast(pl.Float64).alias("mean"),
             pl.col(column).std().cast(pl.Float64).alias("std"),
             pl.col(column).min().cast(pl.Float64).alias("min"),
-            pl.col(column).quantile(0.01).cast(pl.Float64).alias("q01"),
-            pl.col(column).quantile(0.05).cast(pl.Float64).alias("q05"),
-            pl.col(column).quantile(0.1).cast(pl.Float64).alias("q10"),
-            pl.col(column).quantile(0.25).cast(pl.Float64).alias("q25"),
-            pl.col(column).median().cast(pl.Float64).alias("median"),
-            pl.col(column).quantile(0.75).cast(pl.Float64).alias("q75"),
-            pl.col(column).quantile(0.9).cast(pl.Float64).alias("q90"),
-            pl.col(column).quantile(0.95).cast(pl.Float64).alias("q95"),
-            pl.col(column).quantile(0.99).cast(pl.Float64).alias("q99"),
+            values.quantile(0.01).cast(pl.Float64).alias("q01"),
+            values.quantile(0.05).cast(pl.Float64).alias("q05"),
+            values.quantile(0.1).cast(pl.Float64).alias("q10"),
+            values.quantile(0.25).cast(pl.Float64).alias("q25"),
+            values.median().cast(pl.Float64).alias("median"),
+            values.quantile(0.75).cast(pl.Float64).alias("q75"),
+            values.quantile(0.9).cast(pl.Float64).alias("q90"),
+            values.quantile(0.95).cast(pl.Float64).alias("q95"),
+            values.quantile(0.99).cast(pl.Float64).alias("q99"),
             pl.col(column).max().cast(pl.Float64).alias("max"),
         )
         .rename({dt_column: "step"})
     )
 
 
+@frame_cache
+def to_temporal_arrays(
+    frame: pl.DataFrame,
+    column: str,
+    dt_column: str,
+    period: str,
+) -> tuple[list[np.ndarray], list[str]]:
+    r"""Return the values of a column for each temporal window and the
+    associated time steps.
+
+    The temporal windows are the same as the windows created by
+    ``to_temporal_frames``, but only the values of the column are
+    extracted, so the other columns of the DataFrame are not copied.
+    The null values are kept and are represented by NaN in the arrays.
+    The output is cached for each DataFrame inside a
+    ``frame_cache_scope`` context, so the arrays are read-only.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to extract.
+        dt_column: The datetime column used to create the temporal
+            windows.
+        period: The temporal period e.g. monthly or daily.
+
+    Returns:
+        A tuple with the list of arrays and the list of time steps.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.temporal import to_temporal_arrays
+    >>> arrays, steps = to_temporal_arrays(
+    ...     frame=pl.DataFrame(
+    ...         {
+    ...             "col": [None, 1.0, 0.0, 4.2, 42.0],
+    ...             "datetime": [
+    ...                 datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=3, day=4, tzinfo=timezone.utc),
+    ...             ],
+    ...         },
+    ...         schema={
+    ...             "col": pl.Float64,
+    ...             "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    ...         },
+    ...     ),
+    ...     column="col",
+    ...     dt_column="datetime",
+    ...     period="1mo",
+    ... )
+    >>> arrays
+    [array([nan,  0.]), array([1.]), array([ 4.2, 42. ])]
+    >>> steps
+    ['2020-01', '2020-02', '2020-03']
+
+    ```
+    """
+    if frame.is_empty():
+        return [], []
+
+    index, steps = compute_step_index(frame=frame, dt_column=dt_column, period=period)
+    order = np.argsort(index, kind="stable")
+    values = frame[column].to_numpy()[order]
+    bounds = np.searchsorted(index[order], np.arange(len(steps) + 1))
+    return [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])], steps
+
+
 def to_temporal_frames(
     frame: pl.DataFrame,
     dt_column: str,
@@ -183,9 +331,8 @@ def to_temporal_frames(
     if frame.is_empty():
         return [], []
 
-    groups = frame.sort(dt_column).group_by_dynamic(dt_column, every=period)
-    steps = to_step_names(groups=groups, period=period)
-    frames = [frame for _, frame in groups]
+    _, steps = compute_step_index(frame=frame, dt_column=dt_column, period=period)
+    frames = [frame for _, frame in frame.sort(dt_column).group_by_dynamic(dt_column, every=period)]
     return frames, steps
 
 
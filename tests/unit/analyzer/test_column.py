@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import polars as pl
+import pytest
 from coola import objects_are_equal
 
 from flamme.analyzer import ColumnSubsetAnalyzer, NullValueAnalyzer
@@ -59,3 +60,33 @@ def test_column_subset_analyzer_get_statistics_empty() -> None:
             "total_count": (0, 0),
         },
     )
+
+
+def test_column_subset_analyzer_get_statistics_all_columns() -> None:
+    section = ColumnSubsetAnalyzer(
+        columns=["float", "int", "str"], analyzer=NullValueAnalyzer()
+    ).analyze(
+        pl.DataFrame(
+            {
+                "float": [1.2, 4.2, None, 2.2],
+                "int": [None, 1, 0, 1],
+                "str": ["A", "B", None, None],
+            },
+            schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+        )
+    )
+    assert isinstance(section, NullValueSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "columns": ("float", "int", "str"),
+            "null_count": (1, 1, 2),
+            "total_count": (4, 4, 4),
+        },
+    )
+
+
+def test_column_subset_analyzer_missing_columns() -> None:
+    analyzer = ColumnSubsetAnalyzer(columns=["float", "missing"], analyzer=NullValueAnalyzer())
+    with pytest.raises(pl.exceptions.ColumnNotFoundError, match="missing"):
+        analyzer.analyze(pl.DataFrame({"float": [1.2, 4.2, None, 2.2]}))
@@ -29,6 +29,13 @@ def test_column_type_analyzer_str() -> None:
     assert str(DataFrameSummaryAnalyzer()).startswith("DataFrameSummaryAnalyzer(")
 
 
+def test_dataframe_summary_analyzer_str_args() -> None:
+    assert (
+        str(DataFrameSummaryAnalyzer(top=3, sort=True, max_workers=4))
+        == "DataFrameSummaryAnalyzer(top=3, sort=True, max_workers=4)"
+    )
+
+
 def test_column_type_analyzer_get_statistics(dataframe: pl.DataFrame) -> None:
     section = DataFrameSummaryAnalyzer().analyze(dataframe)
     assert isinstance(section, DataFrameSummarySection)
@@ -83,6 +90,18 @@ def test_column_type_analyzer_top_incorrect() -> None:
         DataFrameSummaryAnalyzer(top=-1)
 
 
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_column_type_analyzer_incorrect_max_workers(max_workers: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect max_workers:"):
+        DataFrameSummaryAnalyzer(max_workers=max_workers)
+
+
+def test_column_type_analyzer_max_workers(dataframe: pl.DataFrame) -> None:
+    section = DataFrameSummaryAnalyzer(max_workers=2).analyze(dataframe)
+    assert isinstance(section, DataFrameSummarySection)
+    assert section.render_html_body() == DataFrameSummarySection(dataframe).render_html_body()
+
+
 def test_column_type_analyzer_sort() -> None:
     section = DataFrameSummaryAnalyzer(sort=True).analyze(
         pl.DataFrame(
@@ -104,3 +123,9 @@ def test_column_type_analyzer_sort() -> None:
             "nunique": (5, 2, 4),
         },
     )
+
+
+def test_column_type_analyzer_sort_already_sorted(dataframe: pl.DataFrame) -> None:
+    section = DataFrameSummaryAnalyzer(sort=True).analyze(dataframe)
+    assert isinstance(section, DataFrameSummarySection)
+    assert section.frame is dataframe
@@ -21,6 +21,10 @@ def test_mapping_analyzer_str() -> None:
     assert str(MappingAnalyzer({})).startswith("MappingAnalyzer(")
 
 
+def test_mapping_analyzer_str_max_workers() -> None:
+    assert str(MappingAnalyzer({}, max_workers=4)).endswith("(max_workers): 4\n)")
+
+
 def test_mapping_analyzer_analyzers() -> None:
     analyzer = MappingAnalyzer(
         {
@@ -124,6 +128,51 @@ def test_mapping_analyzer_max_toc_depth(max_toc_depth: int) -> None:
     assert section.max_toc_depth == max_toc_depth
 
 
+@pytest.mark.parametrize("max_workers", [1, 2, 4])
+def test_mapping_analyzer_max_workers(max_workers: int) -> None:
+    section = MappingAnalyzer(
+        {
+            "section1": NullValueAnalyzer(),
+            "section2": DuplicatedRowAnalyzer(),
+            "section3": NullValueAnalyzer(),
+        },
+        max_workers=max_workers,
+    ).analyze(
+        pl.DataFrame(
+            {
+                "float": [1.2, 4.2, None, 2.2],
+                "int": [None, 1, 0, 1],
+                "str": ["A", "B", None, None],
+            },
+            schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+        )
+    )
+    assert isinstance(section, SectionDict)
+    assert list(section.sections) == ["section1", "section2", "section3"]
+    assert objects_are_allclose(
+        section.get_statistics(),
+        {
+            "section1": {
+                "columns": ("float", "int", "str"),
+                "null_count": (1, 1, 2),
+                "total_count": (4, 4, 4),
+            },
+            "section2": {"num_rows": 4, "num_unique_rows": 4},
+            "section3": {
+                "columns": ("float", "int", "str"),
+                "null_count": (1, 1, 2),
+                "total_count": (4, 4, 4),
+            },
+        },
+    )
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_mapping_analyzer_incorrect_max_workers(max_workers: int) -> None:
+    with pytest.raises(ValueError, match="Incorrect max_workers:"):
+        MappingAnalyzer({}, max_workers=max_workers)
+
+
 def test_mapping_analyzer_add_analyzer() -> None:
     analyzer = MappingAnalyzer(
         {
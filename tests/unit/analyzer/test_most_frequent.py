@@ -43,6 +43,17 @@ def test_most_frequent_values_analyzer_get_statistics_drop_nulls_true(
     )
 
 
+def test_most_frequent_values_analyzer_get_statistics_drop_nulls_shared_counts(
+    dataframe: pl.DataFrame,
+) -> None:
+    MostFrequentValuesAnalyzer(column="col", drop_nulls=True).analyze(dataframe)
+    section = MostFrequentValuesAnalyzer(column="col").analyze(dataframe)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"most_common": [(1.0, 3), (None, 2), (42.0, 1), (22.0, 1), (2.0, 1)]},
+    )
+
+
 def test_most_frequent_values_analyzer_get_statistics_empty_no_row() -> None:
     section = MostFrequentValuesAnalyzer(column="col").analyze(
         pl.DataFrame({"col": []}, schema={"col": pl.Int64})
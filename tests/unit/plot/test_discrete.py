@@ -35,6 +35,12 @@ def test_bar_discrete_yscale(yscale: str) -> None:
     bar_discrete(ax=ax, names=["a", "b", "c", "d"], counts=[5, 100, 42, 27], yscale=yscale)
 
 
+def test_bar_discrete_many_values() -> None:
+    _fig, ax = plt.subplots()
+    bar_discrete(ax=ax, names=[f"v{i}" for i in range(1000)], counts=list(range(1000)))
+    assert objects_are_equal(ax.get_xticks().tolist(), list(range(0, 1000, 10)))
+
+
 def test_bar_discrete_empty() -> None:
     _fig, ax = plt.subplots()
     bar_discrete(ax=ax, names=[], counts=[])
@@ -89,6 +95,12 @@ def test_bar_discrete_temporal_proportion_zeros(proportion: bool) -> None:
     )
 
 
+def test_bar_discrete_temporal_many_steps() -> None:
+    _fig, ax = plt.subplots()
+    bar_discrete_temporal(ax=ax, counts=np.ones((2, 1000)))
+    assert objects_are_equal(ax.get_xticks().tolist(), list(range(0, 1000, 10)))
+
+
 def test_bar_discrete_temporal_empty() -> None:
     _fig, ax = plt.subplots()
     bar_discrete_temporal(ax, counts=np.zeros((0, 0)))
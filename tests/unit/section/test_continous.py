@@ -16,6 +16,7 @@ from flamme.section.continuous import (
     create_stats_table,
     to_array,
 )
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE
 
 
 @pytest.fixture
@@ -243,6 +244,15 @@ def test_column_continuous_section_render_html_body_empty() -> None:
     assert isinstance(Template(section.render_html_body()).render(), str)
 
 
+def test_column_continuous_section_render_html_body_only_nan() -> None:
+    section = ColumnContinuousSection(
+        series=pl.Series(values=[float("nan"), None, float("nan")], dtype=pl.Float64), column="col"
+    )
+    html = section.render_html_body()
+    assert html.count(MISSING_FIGURE_MESSAGE) == 2
+    assert "<img" not in html
+
+
 def test_column_continuous_section_render_html_toc(series: pl.Series) -> None:
     section = ColumnContinuousSection(series=series, column="col")
     assert isinstance(Template(section.render_html_toc()).render(), str)
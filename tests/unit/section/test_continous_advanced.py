@@ -12,6 +12,7 @@ from flamme.section.continuous_advanced import (
     create_histogram_range_figure,
     create_section_template,
 )
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE
 
 
 @pytest.fixture
@@ -232,6 +233,15 @@ def test_column_continuous_advanced_section_render_html_body_empty() -> None:
     assert isinstance(Template(section.render_html_body()).render(), str)
 
 
+def test_column_continuous_advanced_section_render_html_body_only_nan() -> None:
+    section = ColumnContinuousAdvancedSection(
+        series=pl.Series(values=[float("nan"), None, float("nan")], dtype=pl.Float64), column="col"
+    )
+    html = section.render_html_body()
+    assert html.count(MISSING_FIGURE_MESSAGE) == 3
+    assert "<img" not in html
+
+
 def test_column_continuous_advanced_section_render_html_toc(series: pl.Series) -> None:
     section = ColumnContinuousAdvancedSection(series=series, column="col")
     assert isinstance(Template(section.render_html_toc()).render(), str)
@@ -299,6 +309,18 @@ def test_create_histogram_range_figure_figsize(
     )
 
 
+def test_create_histogram_range_figure_nan() -> None:
+    assert isinstance(
+        create_histogram_range_figure(
+            series=pl.Series([float("nan"), 1.0, float("nan"), 2.0, 3.0]),
+            column="col",
+            xmin="q0.25",
+            xmax="q0.75",
+        ),
+        plt.Figure,
+    )
+
+
 def test_create_histogram_range_figure_empty() -> None:
     assert (
         create_histogram_range_figure(series=pl.Series([None, None], dtype=pl.Int64), column="col")
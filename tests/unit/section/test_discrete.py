@@ -81,6 +81,14 @@ def test_column_discrete_section_get_statistics_empty_row() -> None:
     )
 
 
+def test_column_discrete_section_get_statistics_zero_count() -> None:
+    section = ColumnDiscreteSection(counter=Counter({"a": 4, "b": 0, "c": 6}), column="col")
+    assert objects_are_allclose(
+        section.get_statistics(),
+        {"most_common": [("c", 6), ("a", 4)], "null_values": 0, "nunique": 2, "total": 10},
+    )
+
+
 def test_column_discrete_section_get_statistics_empty_column() -> None:
     section = ColumnDiscreteSection(counter=Counter({}), column="col")
     assert objects_are_allclose(
@@ -89,6 +97,14 @@ def test_column_discrete_section_get_statistics_empty_column() -> None:
     )
 
 
+def test_column_discrete_section_get_statistics_multiple_calls() -> None:
+    section = ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2, "c": 6}), column="col")
+    section.get_statistics()["most_common"].clear()
+    assert objects_are_allclose(
+        section.get_statistics()["most_common"], [("c", 6), ("a", 4), ("b", 2)]
+    )
+
+
 def test_column_discrete_section_render_html_body() -> None:
     section = ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2, "c": 6}), column="col")
     assert isinstance(Template(section.render_html_body()).render(), str)
@@ -138,6 +154,21 @@ def test_create_histogram_section() -> None:
     )
 
 
+def test_create_histogram_section_null_and_zero_count() -> None:
+    assert isinstance(
+        create_histogram_section(counter=Counter({"a": 4, "b": 0, None: 6}), column="col"), str
+    )
+
+
+def test_create_histogram_section_mixed_types() -> None:
+    assert isinstance(
+        create_histogram_section(
+            counter=Counter({"a": 4, 1: 2, False: 3, None: 6, 2.5: 1}), column="col"
+        ),
+        str,
+    )
+
+
 def test_create_histogram_section_empty() -> None:
     assert isinstance(create_histogram_section(counter=Counter({}), column="col"), str)
 
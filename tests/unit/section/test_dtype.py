@@ -47,6 +47,14 @@ def test_data_type_section_incorrect_missing_key() -> None:
         )
 
 
+def test_data_type_section_incorrect_keys_message() -> None:
+    with pytest.raises(RuntimeError, match=r"keys in only one of them: .*float"):
+        DataTypeSection(
+            dtypes={"int": pl.Int64(), "str": pl.String()},
+            types={"float": {float}, "int": {int}, "str": {str, type(None)}},
+        )
+
+
 def test_data_type_section_get_statistics() -> None:
     section = DataTypeSection(
         dtypes={"float": pl.Float64(), "int": pl.Int64(), "str": pl.String()},
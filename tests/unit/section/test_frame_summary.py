@@ -44,6 +44,14 @@ def test_dataframe_summary_section_top_incorrect(dataframe: pl.DataFrame) -> Non
         DataFrameSummarySection(dataframe, top=-1)
 
 
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_dataframe_summary_section_incorrect_max_workers(
+    dataframe: pl.DataFrame, max_workers: int
+) -> None:
+    with pytest.raises(ValueError, match="Incorrect max_workers:"):
+        DataFrameSummarySection(dataframe, max_workers=max_workers)
+
+
 def test_dataframe_summary_section_get_columns(dataframe: pl.DataFrame) -> None:
     assert DataFrameSummarySection(dataframe).get_columns() == ("float", "int", "str")
 
@@ -91,6 +99,16 @@ def test_dataframe_summary_section_get_most_frequent_values(dataframe: pl.DataFr
     )
 
 
+def test_dataframe_summary_section_get_most_frequent_values_nan() -> None:
+    assert objects_are_allclose(
+        DataFrameSummarySection(
+            pl.DataFrame({"col": [float("nan"), 1.0, float("nan")]})
+        ).get_most_frequent_values(),
+        (((float("nan"), 2), (1.0, 1)),),
+        equal_nan=True,
+    )
+
+
 def test_dataframe_summary_section_get_most_frequent_values_empty() -> None:
     assert DataFrameSummarySection(pl.DataFrame({})).get_most_frequent_values() == ()
 
@@ -139,6 +157,16 @@ def test_column_temporal_null_value_section_render_html_body_args(dataframe: pl.
     )
 
 
+@pytest.mark.parametrize("max_workers", [2, 4])
+def test_column_temporal_null_value_section_render_html_body_max_workers(
+    dataframe: pl.DataFrame, max_workers: int
+) -> None:
+    assert (
+        DataFrameSummarySection(dataframe, max_workers=max_workers).render_html_body()
+        == DataFrameSummarySection(dataframe).render_html_body()
+    )
+
+
 def test_column_temporal_null_value_section_render_html_body_empty_rows() -> None:
     section = DataFrameSummarySection(
         pl.DataFrame(
@@ -96,6 +96,29 @@ def test_create_frequent_values_table_reverse_true() -> None:
     )
 
 
+def test_create_frequent_values_table_reverse_true_order() -> None:
+    table = create_frequent_values_table(
+        Counter({"a": 1, "b": 2, "c": 1, "d": 3}), top=3, reverse=True
+    )
+    assert "<th>d</th>" not in table
+    assert table.index("<th>c</th>") < table.index("<th>a</th>") < table.index("<th>b</th>")
+
+
+def test_create_frequent_values_table_reverse_true_order_large() -> None:
+    counter = Counter({f"v{i}": i % 3 + 1 for i in range(20)})
+    table = create_frequent_values_table(counter, top=3, reverse=True)
+    assert "<th>v0</th>" not in table
+    assert table.index("<th>v18</th>") < table.index("<th>v15</th>") < table.index("<th>v12</th>")
+
+
+def test_create_frequent_values_table_reverse_true_top_0() -> None:
+    # Same as ``counter.most_common()[-0:][::-1]``, i.e. all the values.
+    table = create_frequent_values_table(
+        Counter({f"v{i}": i % 3 + 1 for i in range(20)}), top=0, reverse=True
+    )
+    assert all(f"<th>v{i}</th>" in table for i in range(20))
+
+
 def test_create_frequent_values_table_empty() -> None:
     assert isinstance(create_frequent_values_table(Counter({})), str)
 
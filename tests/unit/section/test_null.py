@@ -211,6 +211,12 @@ def test_create_bar_figure() -> None:
     )
 
 
+def test_create_bar_figure_many_columns() -> None:
+    fig = create_bar_figure(columns=[f"col{i}" for i in range(1000)], null_count=list(range(1000)))
+    assert isinstance(fig, plt.Figure)
+    assert len(fig.axes[0].get_xticks()) == 100
+
+
 def test_create_bar_figure_empty() -> None:
     assert create_bar_figure(columns=[], null_count=[]) is None
 
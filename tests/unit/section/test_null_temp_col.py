@@ -488,3 +488,10 @@ def test_create_temporal_null_table_empty(dataframe_empty: pl.DataFrame) -> None
 
 def test_create_temporal_null_table_row() -> None:
     assert isinstance(create_temporal_null_table_row(label="meow", null=5, total=42), str)
+
+
+def test_create_temporal_null_table_row_values() -> None:
+    row = create_temporal_null_table_row(label="meow", null=5, total=1000)
+    assert '<td style="text-align: right;">5</td>' in row
+    assert '<td style="text-align: right;">995</td>' in row
+    assert '<td style="text-align: right;">1,000</td>' in row
@@ -1,6 +1,25 @@
 from __future__ import annotations
 
-from flamme.section.utils import render_html_toc, tags2id, tags2title, valid_h_tag
+from flamme.section.utils import (
+    compile_template,
+    render_html_toc,
+    tags2id,
+    tags2title,
+    valid_h_tag,
+)
+
+######################################
+#     Tests for compile_template     #
+######################################
+
+
+def test_compile_template() -> None:
+    assert compile_template("<p>{{text}}</p>").render({"text": "meow"}) == "<p>meow</p>"
+
+
+def test_compile_template_cached() -> None:
+    assert compile_template("<p>{{text}}</p>") is compile_template("<p>{{text}}</p>")
+
 
 #############################
 #     Tests for tags2id     #
@@ -60,6 +60,16 @@ def test_rand_replace_prob_0() -> None:
     assert objects_are_equal(rand_replace(np.arange(10), value=-1, prob=0.0), np.arange(10))
 
 
+def test_rand_replace_prob_1() -> None:
+    assert objects_are_equal(rand_replace(np.arange(10), value=-1, prob=1.0), np.full((10,), -1))
+
+
+def test_rand_replace_2d() -> None:
+    out = rand_replace(np.arange(12).reshape(3, 4), value=-1, prob=0.4)
+    assert out.shape == (3, 4)
+    assert np.all(np.logical_or(out == -1, out == np.arange(12).reshape(3, 4)))
+
+
 def test_rand_replace_empty() -> None:
     assert objects_are_equal(rand_replace(np.array([]), value=-1, prob=0.4), np.array([]))
 
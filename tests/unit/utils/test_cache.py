@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import contextvars
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_equal
+
+from flamme.utils.cache import (
+    frame_cache,
+    frame_cache_scope,
+    get_column_set,
+    get_frame_cache,
+)
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", None]})
+
+
+@frame_cache
+def select_first_rows(frame: pl.DataFrame, columns: list[str], n: int = 1) -> np.ndarray:
+    return frame.select(columns).head(n).to_numpy()
+
+
+#######################################
+#     Tests for frame_cache_scope     #
+#######################################
+
+
+def test_frame_cache_scope(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        get_frame_cache(frame)["key"] = 1
+        assert get_frame_cache(frame) == {"key": 1}
+    assert get_frame_cache(frame) == {}
+
+
+def test_frame_cache_scope_release(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        get_frame_cache(frame)["key"] = 1
+    with frame_cache_scope():
+        assert get_frame_cache(frame) == {}
+
+
+def test_frame_cache_scope_nested(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        with frame_cache_scope():
+            get_frame_cache(frame)["key"] = 1
+        assert get_frame_cache(frame) == {"key": 1}
+    assert get_frame_cache(frame) == {}
+
+
+def test_frame_cache_scope_exception(frame: pl.DataFrame) -> None:
+    def fill_cache_and_fail() -> None:
+        with frame_cache_scope():
+            get_frame_cache(frame)["key"] = 1
+            msg = "error"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="error"):
+        fill_cache_and_fail()
+    assert get_frame_cache(frame) == {}
+
+
+def test_frame_cache_scope_other_thread(frame: pl.DataFrame) -> None:
+    with frame_cache_scope(), ThreadPoolExecutor(max_workers=1) as executor:
+        get_frame_cache(frame)["key"] = 1
+        assert executor.submit(get_frame_cache, frame).result() == {}
+
+
+def test_frame_cache_scope_copy_context(frame: pl.DataFrame) -> None:
+    with frame_cache_scope(), ThreadPoolExecutor(max_workers=1) as executor:
+        get_frame_cache(frame)["key"] = 1
+        context = contextvars.copy_context()
+        assert executor.submit(context.run, get_frame_cache, frame).result() == {"key": 1}
+
+
+####################################
+#     Tests for get_column_set     #
+####################################
+
+
+def test_get_column_set(frame: pl.DataFrame) -> None:
+    assert get_column_set(frame) == ["col1", "col2"]
+
+
+def test_get_column_set_empty() -> None:
+    assert get_column_set(pl.DataFrame()) == []
+
+
+def test_get_column_set_scope(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        assert get_column_set(frame) == frozenset({"col1", "col2"})
+
+
+def test_get_column_set_scope_empty() -> None:
+    with frame_cache_scope():
+        assert get_column_set(pl.DataFrame()) == frozenset()
+
+
+def test_get_column_set_cached(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        assert get_column_set(frame) is get_column_set(frame)
+
+
+#####################################
+#     Tests for get_frame_cache     #
+#####################################
+
+
+def test_get_frame_cache(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        cache = get_frame_cache(frame)
+        assert cache == {}
+        assert get_frame_cache(frame) is cache
+
+
+def test_get_frame_cache_different_frames(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        assert get_frame_cache(frame) is not get_frame_cache(frame.select("col1"))
+
+
+def test_get_frame_cache_without_scope(frame: pl.DataFrame) -> None:
+    get_frame_cache(frame)["key"] = 1
+    assert get_frame_cache(frame) == {}
+
+
+#################################
+#     Tests for frame_cache     #
+#################################
+
+
+def test_frame_cache(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        out = select_first_rows(frame, ["col1"])
+        assert objects_are_equal(out, np.array([[1]]))
+        assert select_first_rows(frame, ["col1"]) is out
+
+
+def test_frame_cache_without_scope(frame: pl.DataFrame) -> None:
+    out = select_first_rows(frame, ["col1"])
+    assert objects_are_equal(out, np.array([[1]]))
+    assert select_first_rows(frame, ["col1"]) is not out
+
+
+def test_frame_cache_read_only(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        out = select_first_rows(frame, ["col1"])
+    with pytest.raises(ValueError, match="read-only"):
+        out[0, 0] = 2
+
+
+def test_frame_cache_read_only_tuple(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_arrays(frame: pl.DataFrame) -> tuple[np.ndarray, list]:
+        return frame["col1"].to_numpy().copy(), frame.columns
+
+    with frame_cache_scope():
+        array, columns = get_arrays(frame)
+    assert objects_are_equal(columns, ["col1", "col2"])
+    assert not array.flags.writeable
+
+
+def test_frame_cache_read_only_list(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_arrays(frame: pl.DataFrame) -> list[np.ndarray]:
+        return [frame["col1"].to_numpy().copy()]
+
+    with frame_cache_scope():
+        assert not get_arrays(frame)[0].flags.writeable
+
+
+def test_frame_cache_writeable_without_scope(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_array(frame: pl.DataFrame) -> np.ndarray:
+        return frame["col1"].to_numpy().copy()
+
+    out = get_array(frame)
+    out += 1
+    assert objects_are_equal(out, np.array([2, 3, 4]))
+
+
+def test_frame_cache_writeable_unhashable_args(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_array(frame: pl.DataFrame, mapping: dict) -> np.ndarray:
+        return frame[mapping["column"]].to_numpy().copy()
+
+    with frame_cache_scope():
+        assert get_array(frame, {"column": "col1"}).flags.writeable
+
+
+def test_frame_cache_copy(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_values(frame: pl.DataFrame) -> tuple[list, Counter]:
+        return frame.columns, Counter(frame["col2"].to_list())
+
+    with frame_cache_scope():
+        columns, counter = get_values(frame)
+        columns.clear()
+        counter.clear()
+        assert objects_are_equal(
+            get_values(frame), (["col1", "col2"], Counter({"a": 1, "b": 1, None: 1}))
+        )
+
+
+def test_frame_cache_copy_frame(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_frame(frame: pl.DataFrame) -> pl.DataFrame:
+        return frame.select("col1")
+
+    with frame_cache_scope():
+        get_frame(frame).insert_column(1, pl.Series("col3", [4, 5, 6]))
+        assert get_frame(frame).columns == ["col1"]
+
+
+def test_frame_cache_different_args(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        out1 = select_first_rows(frame, ["col1"])
+        out2 = select_first_rows(frame, ["col1"], n=2)
+    assert objects_are_equal(out1, np.array([[1]]))
+    assert objects_are_equal(out2, np.array([[1], [2]]))
+
+
+def test_frame_cache_different_frames(frame: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        assert objects_are_equal(select_first_rows(frame, ["col1"]), np.array([[1]]))
+        assert objects_are_equal(
+            select_first_rows(pl.DataFrame({"col1": [5, 6]}), ["col1"]), np.array([[5]])
+        )
+
+
+def test_frame_cache_unhashable_args(frame: pl.DataFrame) -> None:
+    @frame_cache
+    def get_value(frame: pl.DataFrame, mapping: dict) -> int:  # noqa: ARG001
+        return mapping["value"]
+
+    with frame_cache_scope():
+        assert get_value(frame, {"value": 1}) == 1
+        assert get_value(frame, {"value": 2}) == 2
@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime, timezone
 
 import numpy as np
@@ -6,11 +7,110 @@ import pytest
 from coola import objects_are_equal
 
 from flamme.utils.count import (
+    compute_column_nunique,
+    compute_column_value_counts,
+    compute_most_frequent_values,
     compute_nunique,
     compute_temporal_count,
     compute_temporal_value_counts,
+    compute_value_counts,
 )
 
+###########################################
+#    Tests for compute_column_nunique     #
+###########################################
+
+
+def test_compute_column_nunique() -> None:
+    frame = pl.DataFrame({"col1": ["A", None, "B", "A"], "col2": [1, 2, 3, 4]})
+    assert compute_column_nunique(frame, column="col1") == 3
+
+
+def test_compute_column_nunique_nan() -> None:
+    frame = pl.DataFrame({"col": [float("nan"), 1.0, float("nan"), None]})
+    assert compute_column_nunique(frame, column="col") == 3
+
+
+def test_compute_column_nunique_empty() -> None:
+    frame = pl.DataFrame({"col1": []}, schema={"col1": pl.String})
+    assert compute_column_nunique(frame, column="col1") == 0
+
+
+################################################
+#    Tests for compute_column_value_counts     #
+################################################
+
+
+def test_compute_column_value_counts() -> None:
+    frame = pl.DataFrame({"col1": ["A", None, "B", "A"], "col2": [1, 2, 3, 4]})
+    counter = compute_column_value_counts(frame, column="col1")
+    assert counter == Counter({"A": 2, None: 1, "B": 1})
+    assert list(counter) == ["A", None, "B"]
+
+
+def test_compute_column_value_counts_copy() -> None:
+    frame = pl.DataFrame({"col1": ["A", None, "B", "A"], "col2": [1, 2, 3, 4]})
+    compute_column_value_counts(frame, column="col1").pop(None)
+    assert compute_column_value_counts(frame, column="col1") == Counter({"A": 2, None: 1, "B": 1})
+
+
+def test_compute_column_value_counts_bool() -> None:
+    frame = pl.DataFrame({"col1": [False, None, True, True]})
+    counter = compute_column_value_counts(frame, column="col1")
+    assert counter == Counter({True: 2, False: 1, None: 1})
+    assert list(counter) == [False, None, True]
+
+
+def test_compute_column_value_counts_empty() -> None:
+    frame = pl.DataFrame({"col1": []}, schema={"col1": pl.String})
+    assert compute_column_value_counts(frame, column="col1") == Counter()
+
+
+#################################################
+#    Tests for compute_most_frequent_values     #
+#################################################
+
+
+def test_compute_most_frequent_values() -> None:
+    frame = pl.DataFrame({"col": ["A", None, "B", "A", "C", "B", "A"]})
+    assert objects_are_equal(
+        compute_most_frequent_values(frame, column="col"),
+        [("A", 3), ("B", 2), (None, 1), ("C", 1)],
+    )
+
+
+def test_compute_most_frequent_values_top() -> None:
+    frame = pl.DataFrame({"col": ["A", None, "B", "A", "C", "B", "A"]})
+    assert objects_are_equal(
+        compute_most_frequent_values(frame, column="col", top=2), [("A", 3), ("B", 2)]
+    )
+
+
+def test_compute_most_frequent_values_top_0() -> None:
+    frame = pl.DataFrame({"col": ["A", None, "B", "A"]})
+    assert objects_are_equal(compute_most_frequent_values(frame, column="col", top=0), [])
+
+
+def test_compute_most_frequent_values_same_order_as_counter() -> None:
+    frame = pl.DataFrame({"col": [3, 1, 2, 1, 2, 3, 4, 5, 5, None]})
+    assert objects_are_equal(
+        compute_most_frequent_values(frame, column="col", top=4),
+        Counter(frame["col"].to_list()).most_common(4),
+    )
+
+
+def test_compute_most_frequent_values_bool() -> None:
+    frame = pl.DataFrame({"col": [None, True, False, True]})
+    assert objects_are_equal(
+        compute_most_frequent_values(frame, column="col"), [(True, 2), (None, 1), (False, 1)]
+    )
+
+
+def test_compute_most_frequent_values_empty() -> None:
+    frame = pl.DataFrame({"col": []}, schema={"col": pl.String})
+    assert objects_are_equal(compute_most_frequent_values(frame, column="col"), [])
+
+
 ####################################
 #    Tests for compute_nunique     #
 ####################################
@@ -180,6 +280,85 @@ def test_compute_temporal_value_counts_drop_nulls() -> None:
     assert objects_are_equal(values, ["0.0", "1.0", "4.2", "42.0"])
 
 
+def test_compute_temporal_value_counts_daily() -> None:
+    counts, steps, values = compute_temporal_value_counts(
+        pl.DataFrame(
+            {
+                "col": ["a", "b", None, "a", "b"],
+                "datetime": [
+                    datetime(year=2020, month=1, day=3, hour=1, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=3, hour=5, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                    None,
+                ],
+            },
+            schema={
+                "col": pl.String,
+                "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+            },
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1d",
+    )
+    assert objects_are_equal(counts, np.array([[1, 0, 1], [1, 0, 0], [0, 1, 0]]))
+    assert objects_are_equal(steps, ["2020-01-03", "2020-01-04", "2020-01-05"])
+    assert objects_are_equal(values, ["a", "b", "null"])
+
+
+def test_compute_temporal_value_counts_null_string() -> None:
+    counts, steps, values = compute_temporal_value_counts(
+        pl.DataFrame(
+            {
+                "col": ["null", None, "null", "a"],
+                "datetime": [
+                    datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=6, tzinfo=timezone.utc),
+                ],
+            },
+            schema={
+                "col": pl.String,
+                "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+            },
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+    )
+    assert objects_are_equal(counts, np.array([[1], [3]]))
+    assert objects_are_equal(steps, ["2020-01"])
+    assert objects_are_equal(values, ["a", "null"])
+
+
+def test_compute_temporal_value_counts_drop_nulls_empty_step() -> None:
+    counts, steps, values = compute_temporal_value_counts(
+        pl.DataFrame(
+            {
+                "col": [1, None, 2],
+                "datetime": [
+                    datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+                ],
+            },
+            schema={
+                "col": pl.Int64,
+                "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+            },
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+        drop_nulls=True,
+    )
+    assert objects_are_equal(counts, np.array([[1, 0], [0, 1]]))
+    assert objects_are_equal(steps, ["2020-01", "2020-03"])
+    assert objects_are_equal(values, ["1", "2"])
+
+
 def test_compute_temporal_value_counts_empty() -> None:
     counts, steps, values = compute_temporal_value_counts(
         pl.DataFrame(
@@ -196,3 +375,48 @@ def test_compute_temporal_value_counts_empty() -> None:
     assert objects_are_equal(counts, np.zeros((0, 0), dtype=np.int64))
     assert objects_are_equal(steps, [])
     assert objects_are_equal(values, [])
+
+
+#########################################
+#    Tests for compute_value_counts     #
+#########################################
+
+
+def test_compute_value_counts() -> None:
+    counter = compute_value_counts(pl.Series([None, 1, 0, 1, 2, 1, None], dtype=pl.Int64))
+    assert counter == Counter({1: 3, None: 2, 0: 1, 2: 1})
+    assert list(counter) == [None, 1, 0, 2]
+
+
+def test_compute_value_counts_str() -> None:
+    assert compute_value_counts(pl.Series(["A", "B", None, "A"])) == Counter(
+        {"A": 2, "B": 1, None: 1}
+    )
+
+
+def test_compute_value_counts_bool() -> None:
+    counter = compute_value_counts(pl.Series([False, None, True, False, None, False]))
+    assert counter == Counter({False: 3, None: 2, True: 1})
+    assert list(counter) == [False, None, True]
+
+
+def test_compute_value_counts_bool_without_null() -> None:
+    counter = compute_value_counts(pl.Series([True, False, True]))
+    assert counter == Counter({True: 2, False: 1})
+    assert list(counter) == [True, False]
+
+
+def test_compute_value_counts_bool_only_null() -> None:
+    assert compute_value_counts(pl.Series([None, None], dtype=pl.Boolean)) == Counter({None: 2})
+
+
+def test_compute_value_counts_bool_empty() -> None:
+    assert compute_value_counts(pl.Series([], dtype=pl.Boolean)) == Counter()
+
+
+def test_compute_value_counts_name() -> None:
+    assert compute_value_counts(pl.Series("count", [1, 1, 2])) == Counter({1: 2, 2: 1})
+
+
+def test_compute_value_counts_empty() -> None:
+    assert compute_value_counts(pl.Series([], dtype=pl.Int64)) == Counter()
@@ -83,6 +83,25 @@ def test_series_types_string() -> None:
     assert series_types(pl.Series(["A", "B", "c", "d", None], dtype=pl.String)) == {str, type(None)}
 
 
+def test_series_types_float_without_null() -> None:
+    assert series_types(pl.Series([1.0, float("nan"), 2.0], dtype=pl.Float64)) == {float}
+
+
+def test_series_types_list() -> None:
+    assert series_types(pl.Series([[1, 2], None, [3]], dtype=pl.List(pl.Int64))) == {
+        list,
+        type(None),
+    }
+
+
+def test_series_types_only_null() -> None:
+    assert series_types(pl.Series([None, None], dtype=pl.Int64)) == {type(None)}
+
+
+def test_series_types_empty_int() -> None:
+    assert series_types(pl.Series([], dtype=pl.Int64)) == set()
+
+
 def test_series_types_empty() -> None:
     assert series_types(pl.Series([], dtype=pl.Object)) == set()
 
@@ -9,6 +9,7 @@ import pytest
 from coola import objects_are_equal
 from polars.testing import assert_frame_equal
 
+from flamme.utils.cache import frame_cache_scope
 from flamme.utils.null import (
     compute_null,
     compute_null_count,
@@ -224,6 +225,21 @@ def test_compute_temporal_null_count_empty(dataframe_empty: pl.DataFrame) -> Non
     )
 
 
+def test_compute_temporal_null_count_cached(dataframe: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        nulls, totals, labels = compute_temporal_null_count(
+            frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+        )
+        out = compute_temporal_null_count(
+            frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+        )
+    assert out[0] is nulls
+    assert out[1] is totals
+    assert out[2] == labels
+    assert out[2] is not labels
+    assert not nulls.flags.writeable
+
+
 def test_compute_temporal_null_count_monthly(dataframe: pl.DataFrame) -> None:
     assert objects_are_equal(
         compute_temporal_null_count(
@@ -260,6 +260,13 @@ def test_compute_statistics_continuous_array_single_numeric_value() -> None:
     )
 
 
+def test_compute_statistics_continuous_array_skewness_kurtosis() -> None:
+    stats = compute_statistics_continuous_array(np.array([0, 0, 0, 1]))
+    assert objects_are_allclose(
+        (stats["skewness"], stats["kurtosis"]), (1.1547005383792515, -0.6666666666666667)
+    )
+
+
 def test_compute_statistics_continuous_array_only_nans() -> None:
     assert objects_are_allclose(
         compute_statistics_continuous_array(np.asarray([np.nan, np.nan, np.nan, np.nan])),
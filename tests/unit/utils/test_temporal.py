@@ -2,14 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import numpy as np
 import polars as pl
 import pytest
 from coola import objects_are_equal
 from polars.testing import assert_frame_equal
 
+from flamme.utils.cache import frame_cache_scope
 from flamme.utils.temporal import (
+    compute_step_index,
     compute_temporal_stats,
     to_step_names,
+    to_temporal_arrays,
     to_temporal_frames,
 )
 
@@ -258,6 +262,69 @@ def test_to_temporal_frames_empty() -> None:
     )
 
 
+########################################
+#     Tests for to_temporal_arrays     #
+########################################
+
+
+def test_to_temporal_arrays_monthly(dataframe: pl.DataFrame) -> None:
+    arrays, steps = to_temporal_arrays(dataframe, column="col", dt_column="datetime", period="1mo")
+    assert objects_are_equal(
+        arrays, [np.array([1.0, 2.0, 3.0]), np.array([4.0]), np.array([5.0]), np.array([0.0])]
+    )
+    assert objects_are_equal(steps, ["2020-01", "2020-02", "2020-03", "2020-04"])
+
+
+def test_to_temporal_arrays_yearly(dataframe: pl.DataFrame) -> None:
+    arrays, steps = to_temporal_arrays(dataframe, column="col", dt_column="datetime", period="1y")
+    assert objects_are_equal(arrays, [np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])])
+    assert objects_are_equal(steps, ["2020"])
+
+
+def test_to_temporal_arrays_same_steps_as_frames(dataframe: pl.DataFrame) -> None:
+    arrays, steps = to_temporal_arrays(dataframe, column="col", dt_column="datetime", period="1w")
+    frames, frame_steps = to_temporal_frames(dataframe, dt_column="datetime", period="1w")
+    assert steps == frame_steps
+    assert objects_are_equal(arrays, [np.sort(frame["col"].to_numpy()) for frame in frames])
+
+
+def test_to_temporal_arrays_null() -> None:
+    arrays, steps = to_temporal_arrays(
+        pl.DataFrame(
+            {
+                "col": [None, 1, 0, None],
+                "datetime": [
+                    datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                    datetime(year=2020, month=2, day=4, tzinfo=timezone.utc),
+                ],
+            },
+            schema={"col": pl.Int64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+    )
+    assert objects_are_equal(
+        arrays, [np.array([float("nan"), 0.0]), np.array([1.0, float("nan")])], equal_nan=True
+    )
+    assert objects_are_equal(steps, ["2020-01", "2020-02"])
+
+
+def test_to_temporal_arrays_read_only(dataframe: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        arrays, _ = to_temporal_arrays(dataframe, column="col", dt_column="datetime", period="1mo")
+    assert not any(array.flags.writeable for array in arrays)
+
+
+def test_to_temporal_arrays_empty() -> None:
+    assert objects_are_equal(
+        to_temporal_arrays(pl.DataFrame({}), column="col", dt_column="datetime", period="1mo"),
+        ([], []),
+    )
+
+
 ###################################
 #     Tests for to_step_names     #
 ###################################
@@ -288,3 +355,70 @@ def test_to_step_names_empty() -> None:
         .group_by_dynamic("datetime", every="1mo")
     )
     assert objects_are_equal(to_step_names(groups=groups, period="1mo"), [])
+
+
+########################################
+#     Tests for compute_step_index     #
+########################################
+
+
+def test_compute_step_index_monthly(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_step_index(dataframe, dt_column="datetime", period="1mo"),
+        (np.array([3, 0, 0, 0, 1, 2]), ["2020-01", "2020-02", "2020-03", "2020-04"]),
+    )
+
+
+def test_compute_step_index_yearly(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_step_index(dataframe, dt_column="datetime", period="1y"),
+        (np.array([0, 0, 0, 0, 0, 0]), ["2020"]),
+    )
+
+
+def test_compute_step_index_null() -> None:
+    assert objects_are_equal(
+        compute_step_index(
+            pl.DataFrame(
+                {
+                    "datetime": [
+                        datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                        None,
+                        datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                    ]
+                },
+                schema={"datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+            ),
+            dt_column="datetime",
+            period="1mo",
+        ),
+        (np.array([1, -1, 0]), ["2020-01", "2020-02"]),
+    )
+
+
+def test_compute_step_index_empty() -> None:
+    assert objects_are_equal(
+        compute_step_index(
+            pl.DataFrame(
+                {"datetime": []},
+                schema={"datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+            ),
+            dt_column="datetime",
+            period="1mo",
+        ),
+        (np.array([], dtype=np.int64), []),
+    )
+
+
+def test_compute_step_index_cached(dataframe: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        index, _ = compute_step_index(dataframe, dt_column="datetime", period="1mo")
+        assert compute_step_index(dataframe, dt_column="datetime", period="1mo")[0] is index
+    assert not index.flags.writeable
+
+
+def test_compute_step_index_steps_copy(dataframe: pl.DataFrame) -> None:
+    with frame_cache_scope():
+        compute_step_index(dataframe, dt_column="datetime", period="1mo")[1].clear()
+        _, steps = compute_step_index(dataframe, dt_column="datetime", period="1mo")
+    assert objects_are_equal(steps, ["2020-01", "2020-02", "2020-03", "2020-04"])